@@ -47,6 +47,7 @@ Example Usage:
 """
 
 import random
+from collections.abc import Callable, Sequence
 from typing import NamedTuple
 from config import (
     IMM_12BIT_MIN,
@@ -69,8 +70,6 @@ from encoders.op_tables import (
     # A extension (atomics)
     AMO,
     AMO_LR_SC,
-    # Machine-mode trap instructions (for directed tests only)
-    TRAP_INSTRS,
     # C extension (compressed instructions)
     C_ALU_REG,
     C_ALU_FULL,
@@ -82,6 +81,8 @@ from encoders.op_tables import (
     C_STORES_STACK,
     C_BRANCHES,
     C_JUMPS,
+    C_SPECIAL,
+    C_ALL,
     # F extension (floating-point)
     FP_ARITH_2OP,
     FP_ARITH_1OP,
@@ -96,6 +97,19 @@ from encoders.op_tables import (
     FP_CLASS,
     FP_LOADS,
     FP_STORES,
+    # Flat dispatch
+    ALL_OPS,
+    OPERANDS_RD_RS1_RS2,
+    OPERANDS_RD_RS1_IMM,
+    OPERANDS_RD_RS1,
+    OPERANDS_RS2_RS1_IMM,
+    OPERANDS_RS2_RS1_OFFSET,
+    OPERANDS_RD_OFFSET,
+    OPERANDS_NONE,
+    OPERANDS_RD_CSR_RS1,
+    OPERANDS_RD_CSR_IMM,
+    OPERANDS_RD_RS2_RS1,
+    OPERANDS_RD_RS1_RS2_RS3,
 )
 from encoders.compressed_encode import enc_c_nop
 from utils.memory_utils import generate_aligned_immediate
@@ -154,6 +168,61 @@ ALL_FP_OPS = FP_OPS_TO_FP_REG | FP_OPS_TO_INT_REG | FP_OPS_NO_WRITE
 """All floating-point operations."""
 
 
+def _encode_csr(
+    encoder: Callable[..., int], rd: int, csr_address: int | None, operand: int
+) -> int:
+    assert csr_address is not None, "CSR address required for CSR instructions"
+    return encoder(rd, csr_address, operand)
+
+
+# Operand routing per ALL_OPS layout tag. Every route takes
+# (encoder, rd, rs1, rs2, imm, offset, csr, rs3) positionally and forwards the
+# operands its layout names, in encoder argument order.
+_ENCODE_BY_LAYOUT: dict[int, Callable[..., int]] = {
+    OPERANDS_RD_RS1_RS2: lambda encoder, rd, rs1, rs2, imm, offset, csr, rs3: (
+        encoder(rd, rs1, rs2)
+    ),
+    OPERANDS_RD_RS1_IMM: lambda encoder, rd, rs1, rs2, imm, offset, csr, rs3: (
+        encoder(rd, rs1, imm)
+    ),
+    OPERANDS_RD_RS1: lambda encoder, rd, rs1, rs2, imm, offset, csr, rs3: (
+        encoder(rd, rs1)
+    ),
+    OPERANDS_RS2_RS1_IMM: lambda encoder, rd, rs1, rs2, imm, offset, csr, rs3: (
+        encoder(rs2, rs1, imm)
+    ),
+    OPERANDS_RS2_RS1_OFFSET: lambda encoder, rd, rs1, rs2, imm, offset, csr, rs3: (
+        encoder(rs2, rs1, offset)
+    ),
+    OPERANDS_RD_OFFSET: lambda encoder, rd, rs1, rs2, imm, offset, csr, rs3: (
+        encoder(rd, offset)
+    ),
+    OPERANDS_NONE: lambda encoder, rd, rs1, rs2, imm, offset, csr, rs3: encoder(),
+    OPERANDS_RD_CSR_RS1: lambda encoder, rd, rs1, rs2, imm, offset, csr, rs3: (
+        _encode_csr(encoder, rd, csr, rs1)
+    ),
+    OPERANDS_RD_CSR_IMM: lambda encoder, rd, rs1, rs2, imm, offset, csr, rs3: (
+        _encode_csr(encoder, rd, csr, imm)
+    ),
+    OPERANDS_RD_RS2_RS1: lambda encoder, rd, rs1, rs2, imm, offset, csr, rs3: (
+        encoder(rd, rs2, rs1)
+    ),
+    OPERANDS_RD_RS1_RS2_RS3: lambda encoder, rd, rs1, rs2, imm, offset, csr, rs3: (
+        encoder(rd, rs1, rs2, rs3)
+    ),
+}
+assert {
+    layout for layout, _, _ in ALL_OPS.values()
+} <= _ENCODE_BY_LAYOUT.keys(), "every ALL_OPS layout needs an operand route"
+
+# Mnemonic -> (operand route, encoder), resolved once so encoding an
+# instruction costs a single dict lookup before the encoder call.
+_ROUTE_AND_ENCODER: dict[str, tuple[Callable[..., int], Callable[..., int]]] = {
+    operation: (_ENCODE_BY_LAYOUT[layout], encoder)
+    for operation, (layout, encoder, _) in ALL_OPS.items()
+}
+
+
 class InstructionGenerator:
     """Generates random RISC-V instructions for testing.
 
@@ -216,7 +285,7 @@ class InstructionGenerator:
 
     @staticmethod
     def generate_random_instruction(
-        register_file_state: list[int],
+        register_file_state: Sequence[int],
         force_one_address: bool = False,
         constrain_to_memory_size: int | None = None,
     ) -> InstructionParams:
@@ -359,7 +428,7 @@ class InstructionGenerator:
 
     @staticmethod
     def generate_random_fp_instruction(
-        int_register_file_state: list[int],
+        int_register_file_state: Sequence[int],
         fp_register_file_state: list[int],
         constrain_to_memory_size: int | None = None,
     ) -> InstructionParams:
@@ -430,7 +499,7 @@ class InstructionGenerator:
 
     @staticmethod
     def generate_random_instruction_with_fp(
-        int_register_file_state: list[int],
+        int_register_file_state: Sequence[int],
         fp_register_file_state: list[int],
         force_one_address: bool = False,
         constrain_to_memory_size: int | None = None,
@@ -497,162 +566,21 @@ class InstructionGenerator:
             >>> isinstance(instr, int)
             True
         """
-        if operation in R_ALU:
-            # R-type format: register-register operations
-            encoder_function, _ = R_ALU[operation]
-            return encoder_function(
-                destination_register, source_register_1, source_register_2
-            )
-        elif operation in I_ALU:
-            # I-type format: immediate operations
-            encoder_function, _ = I_ALU[operation]
-            return encoder_function(
-                destination_register, source_register_1, immediate_value
-            )
-        elif operation in I_UNARY:
-            # I-type format: unary operations (Zbb clz, ctz, cpop, sext.b, sext.h, orc.b, rev8)
-            encoder_function, _ = I_UNARY[operation]
-            return encoder_function(destination_register, source_register_1)
-        elif operation in LOADS:
-            # I-type format: load operations
-            encoder_function, _ = LOADS[operation]
-            return encoder_function(
-                destination_register, source_register_1, immediate_value
-            )
-        elif operation in STORES:
-            # S-type format: store operations (no destination register)
-            encoder_function = STORES[operation]
-            return encoder_function(
-                source_register_2, source_register_1, immediate_value
-            )
-        elif operation in BRANCHES:
-            # B-type format: branch operations
-            encoder_function = BRANCHES[operation]
-            return encoder_function(source_register_2, source_register_1, branch_offset)
-        elif operation in JUMPS:
-            # J-type format: jump operations
-            encoder_function = JUMPS[operation]
-            return (
-                encoder_function(destination_register, branch_offset)
-                if operation == "jal"
-                else encoder_function(
-                    destination_register, source_register_1, immediate_value
-                )
-            )
-        elif operation in FENCES:
-            # Fence instructions take no operands (fixed encoding)
-            encoder_function = FENCES[operation]
-            return encoder_function()
-        elif operation in CSRS:
-            # CSR instructions: read/modify CSR registers
-            # For Zicntr counters, we use pure reads (rs1=0 or zimm=0)
-            encoder_function = CSRS[operation]
-            assert csr_address is not None, "CSR address required for CSR instructions"
-            if operation in ("csrrw", "csrrs", "csrrc"):
-                # Register-based CSR instructions: csrXX rd, csr, rs1
-                return encoder_function(
-                    destination_register, csr_address, source_register_1
-                )
-            else:
-                # Immediate-based CSR instructions: csrXXi rd, csr, zimm
-                return encoder_function(
-                    destination_register, csr_address, immediate_value
-                )
-        elif operation in AMO:
-            # A extension: Atomic memory operations (amoswap.w, amoadd.w, etc.)
-            # Format: AMO rd, rs2, (rs1) - atomically loads from rs1, computes, stores
-            encoder_function, _ = AMO[operation]
-            return encoder_function(
-                destination_register, source_register_2, source_register_1
-            )
-        elif operation in AMO_LR_SC:
-            # A extension: Load-reserved / Store-conditional
-            encoder_function = AMO_LR_SC[operation]
-            if operation == "lr.w":
-                # LR.W rd, (rs1) - Load and set reservation
-                return encoder_function(destination_register, source_register_1)
-            else:
-                # SC.W rd, rs2, (rs1) - Store conditional
-                return encoder_function(
-                    destination_register, source_register_2, source_register_1
-                )
-        elif operation in TRAP_INSTRS:
-            # Machine-mode trap instructions (ECALL, EBREAK, MRET, WFI)
-            # These take no operands - fixed encodings
-            encoder_function = TRAP_INSTRS[operation]
-            return encoder_function()
-        # F extension (floating-point) instruction encoding
-        elif operation in FP_ARITH_2OP:
-            # Two-operand FP arithmetic (fadd.s, fsub.s, fmul.s, fdiv.s)
-            encoder_function, _ = FP_ARITH_2OP[operation]
-            return encoder_function(
-                destination_register, source_register_1, source_register_2
-            )
-        elif operation in FP_ARITH_1OP:
-            # Single-operand FP arithmetic (fsqrt.s)
-            encoder_function, _ = FP_ARITH_1OP[operation]
-            return encoder_function(destination_register, source_register_1)
-        elif operation in FP_FMA:
-            # Fused multiply-add (fmadd.s, fmsub.s, fnmadd.s, fnmsub.s)
-            encoder_function, _ = FP_FMA[operation]
-            return encoder_function(
-                destination_register,
-                source_register_1,
-                source_register_2,
-                source_register_3,
-            )
-        elif operation in FP_SGNJ:
-            # Sign injection (fsgnj.s, fsgnjn.s, fsgnjx.s)
-            encoder_function, _ = FP_SGNJ[operation]
-            return encoder_function(
-                destination_register, source_register_1, source_register_2
-            )
-        elif operation in FP_MINMAX:
-            # Min/max (fmin.s, fmax.s)
-            encoder_function, _ = FP_MINMAX[operation]
-            return encoder_function(
-                destination_register, source_register_1, source_register_2
-            )
-        elif operation in FP_CMP:
-            # Comparison (feq.s, flt.s, fle.s) - result to integer register
-            encoder_function, _ = FP_CMP[operation]
-            return encoder_function(
-                destination_register, source_register_1, source_register_2
-            )
-        elif operation in FP_CVT_F2I:
-            # FP to integer conversion (fcvt.w.s, fcvt.wu.s)
-            encoder_function, _ = FP_CVT_F2I[operation]
-            return encoder_function(destination_register, source_register_1)
-        elif operation in FP_CVT_I2F:
-            # Integer to FP conversion (fcvt.s.w, fcvt.s.wu)
-            encoder_function, _ = FP_CVT_I2F[operation]
-            return encoder_function(destination_register, source_register_1)
-        elif operation in FP_MV_F2I:
-            # FP bits to integer move (fmv.x.w)
-            encoder_function, _ = FP_MV_F2I[operation]
-            return encoder_function(destination_register, source_register_1)
-        elif operation in FP_MV_I2F:
-            # Integer bits to FP move (fmv.w.x)
-            encoder_function, _ = FP_MV_I2F[operation]
-            return encoder_function(destination_register, source_register_1)
-        elif operation in FP_CLASS:
-            # Classify (fclass.s)
-            encoder_function, _ = FP_CLASS[operation]
-            return encoder_function(destination_register, source_register_1)
-        elif operation in FP_LOADS:
-            # FP load (flw)
-            encoder_function, _ = FP_LOADS[operation]
-            return encoder_function(
-                destination_register, source_register_1, immediate_value
-            )
-        elif operation in FP_STORES:
-            # FP store (fsw)
-            encoder_function = FP_STORES[operation]
-            return encoder_function(
-                source_register_2, source_register_1, immediate_value
-            )
-        else:
-            raise RuntimeError(f"Unknown operation: {operation}")
+        # One flat lookup resolves both the encoder and which operands it takes
+        try:
+            route, encoder_function = _ROUTE_AND_ENCODER[operation]
+        except KeyError:
+            raise RuntimeError(f"Unknown operation: {operation}") from None
+        return route(
+            encoder_function,
+            destination_register,
+            source_register_1,
+            source_register_2,
+            immediate_value,
+            branch_offset,
+            csr_address,
+            source_register_3,
+        )
 
 
 class CompressedInstructionParams(NamedTuple):
@@ -707,6 +635,11 @@ class CompressedInstructionGenerator:
         + list(C_BRANCHES.keys())
     )
 
+    # Operations drawn by random tests, in C_ALL order. C_SPECIAL (c.lui,
+    # c.addi16sp) and the stores, branches and jumps are excluded because
+    # they have side effects that are harder to verify.
+    RANDOM_OPS = tuple(op for op in C_ALL if op not in C_SPECIAL)
+
     @staticmethod
     def get_all_compressed_operations() -> list[str]:
         """Get list of all supported compressed operations.
@@ -714,20 +647,11 @@ class CompressedInstructionGenerator:
         Returns:
             List of compressed operation mnemonics
         """
-        ops: list[str] = []
-        ops.extend(C_ALU_REG.keys())
-        ops.extend(C_ALU_FULL.keys())
-        ops.extend(C_ALU_IMM_LIMITED.keys())
-        ops.extend(C_ALU_IMM_FULL.keys())
-        ops.extend(C_LOADS_LIMITED.keys())
-        ops.extend(C_LOADS_STACK.keys())
-        # Note: C_STORES, C_BRANCHES, C_JUMPS excluded from random tests
-        # because they have side effects that are harder to verify
-        return ops
+        return list(CompressedInstructionGenerator.RANDOM_OPS)
 
     @staticmethod
     def generate_random_compressed_instruction(
-        register_file_state: list[int],
+        register_file_state: Sequence[int],
     ) -> CompressedInstructionParams:
         """Generate random compressed RISC-V instruction parameters.
 
@@ -737,10 +661,7 @@ class CompressedInstructionGenerator:
         Returns:
             CompressedInstructionParams with instruction details
         """
-        available_operations = (
-            CompressedInstructionGenerator.get_all_compressed_operations()
-        )
-        operation = random.choice(available_operations)
+        operation = random.choice(CompressedInstructionGenerator.RANDOM_OPS)
 
         # Default values
         destination_register = 0
@@ -836,14 +757,13 @@ class CompressedInstructionGenerator:
         Raises:
             RuntimeError: If operation is not recognized
         """
+        # Tables are tested in the order random tests hit them: operations are
+        # drawn uniformly from get_all_compressed_operations(), so larger tables
+        # come first; stores, branches and jumps only come from directed tests.
         if operation in C_ALU_REG:
             encoder_function, _ = C_ALU_REG[operation]
             return encoder_function(destination_register, source_register_2)
 
-        elif operation in C_ALU_FULL:
-            encoder_function, _ = C_ALU_FULL[operation]
-            return encoder_function(destination_register, source_register_2)
-
         elif operation in C_ALU_IMM_LIMITED:
             encoder_function, _ = C_ALU_IMM_LIMITED[operation]
             return encoder_function(destination_register, immediate_value)
@@ -852,6 +772,10 @@ class CompressedInstructionGenerator:
             encoder_function, _ = C_ALU_IMM_FULL[operation]
             return encoder_function(destination_register, immediate_value)
 
+        elif operation in C_ALU_FULL:
+            encoder_function, _ = C_ALU_FULL[operation]
+            return encoder_function(destination_register, source_register_2)
+
         elif operation in C_LOADS_LIMITED:
             encoder_function, _ = C_LOADS_LIMITED[operation]
             return encoder_function(
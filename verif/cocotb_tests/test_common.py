@@ -29,6 +29,7 @@ Contents:
     handle_branch_flush: Handle pipeline flush after taken branches
     flush_remaining_outputs: Drain pipeline after test completion
     execute_nop: Execute a NOP instruction and model its effects
+    drive_nops: Drive a run of NOPs with a single clock-cycle wait
 
 Usage:
     from cocotb_tests.test_common import (
@@ -36,16 +37,18 @@ Usage:
         handle_branch_flush,
         flush_remaining_outputs,
         execute_nop,
+        drive_nops,
     )
 """
 
 import cocotb
-from cocotb.triggers import RisingEdge, FallingEdge
+from cocotb.triggers import ClockCycles, RisingEdge, FallingEdge
 from dataclasses import dataclass
 from typing import Any
 
 from config import (
     MASK32,
+    NOP_INSTRUCTION,
     DEFAULT_NUM_TEST_LOOPS,
     DEFAULT_MIN_COVERAGE_COUNT,
     DEFAULT_MEMORY_INIT_SIZE,
@@ -205,28 +208,55 @@ async def execute_nop(
         state: Test state for tracking expectations
         log_instr: If True, log the NOP execution for debugging
     """
-    from encoders.op_tables import I_ALU
-
     await FallingEdge(dut_if.clock)
     await dut_if.wait_ready()
 
-    enc_addi, _ = I_ALU["addi"]
-    instr = enc_addi(0, 0, 0)  # NOP
-
     queue_len = len(state.register_file_current_expected_queue)
     if log_instr:
         cocotb.log.info(f"NOP: queue len before={queue_len}")
 
     # Queue expected outputs (no register change)
-    state.register_file_current_expected_queue.append(
-        state.register_file_current.copy()
-    )
+    state.register_file_current_expected_queue.append(state.register_file_current[:])
     expected_pc = (state.program_counter_current + 4) & MASK32
     state.program_counter_expected_values_queue.append(expected_pc)
 
-    dut_if.instruction = instr
+    dut_if.instruction = NOP_INSTRUCTION
     await RisingEdge(dut_if.clock)
 
     state.increment_cycle_counter()
     state.increment_instret_counter()
     state.update_program_counter(expected_pc)
+
+
+async def drive_nops(dut_if: DUTInterface, state: TestState, count: int) -> None:
+    """Drive ``count`` back-to-back NOPs and model their effects in bulk.
+
+    Holds the NOP on the instruction bus for ``count`` rising edges instead of
+    ping-ponging FallingEdge/RisingEdge per instruction. Expectations for the
+    whole run are queued before the first edge, and the PC stages and counters
+    are updated once afterwards.
+
+    Unlike a loop of :func:`execute_nop`, readiness is checked only once, at
+    the start of the run. Use it only where the pipeline cannot stall during
+    the run, for example when draining after single-cycle or memory
+    instructions: a stalled cycle would not retire a NOP, and the queues would
+    drift. Register and PC monitors must also not be running. They would see
+    the expectations for the whole run at once instead of one per cycle.
+    Directed tests check results explicitly and leave those monitors off.
+
+    Args:
+        dut_if: DUT interface for signal access
+        state: Test state for tracking expectations
+        count: Number of NOPs to drive
+    """
+    if count <= 0:
+        return
+
+    await FallingEdge(dut_if.clock)
+    await dut_if.wait_ready()
+
+    expected_pcs = state.queue_nop_expectations(count)
+    dut_if.instruction = NOP_INSTRUCTION
+    await ClockCycles(dut_if.clock, count)
+
+    state.retire_nops(expected_pcs)
@@ -61,6 +61,7 @@ Usage:
 """
 
 import cocotb
+from collections import deque
 from cocotb.clock import Clock
 from cocotb.triggers import RisingEdge, FallingEdge
 from typing import Any
@@ -126,9 +127,8 @@ async def run_compressed_instruction_test(
 
     # Initialize memory model (required for pipeline operation)
     mem_model = MemoryModel(dut)
-    cocotb.start_soon(
-        mem_model.driver_and_monitor([], [])  # Empty queues, not checking memory
-    )
+    # Empty queues, not checking memory
+    cocotb.start_soon(mem_model.driver_and_monitor(deque(), deque()))
 
     # Reference to register file for reading values
     regfile_ram = dut_if.dut.device_under_test.regfile_inst.source_register_1_ram.ram
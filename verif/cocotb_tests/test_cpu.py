@@ -56,6 +56,7 @@ Entry Points:
 """
 
 import cocotb
+from array import array
 from cocotb.clock import Clock
 from cocotb.triggers import RisingEdge, FallingEdge
 from typing import Any
@@ -87,6 +88,13 @@ from cocotb_tests.test_common import (
 )
 from utils.instruction_logger import InstructionLogger
 
+# Operation groupings used by the per-instruction logging, built once at import
+# rather than re-merging the op tables for every instruction.
+_NO_IMMEDIATE_OPS = frozenset(R_ALU.keys() | BRANCHES.keys() | JUMPS.keys())
+_MEMORY_OPS = frozenset(LOADS.keys() | STORES.keys())
+_ALL_LOAD_OPS = frozenset(LOADS.keys() | FP_LOADS.keys())
+_ALL_STORE_OPS = frozenset(STORES.keys() | FP_STORES.keys())
+
 
 # ============================================================================
 # Main Random Regression Test
@@ -144,7 +152,7 @@ async def test_random_riscv_regression_main(
     state.csr_cycle_counter = reset_cycle_count - config.reset_cycles
 
     # Initialize register file AFTER reset
-    state.register_file_current = dut_if.initialize_registers()
+    state.register_file_current = array("I", dut_if.initialize_registers())
 
     # Start concurrent monitors (run in background, checking outputs as they arrive)
     cocotb.start_soon(regfile_monitor(dut, state.register_file_current_expected_queue))
@@ -160,7 +168,7 @@ async def test_random_riscv_regression_main(
     )
 
     # Initialize register file state for first instruction.
-    state.register_file_previous = state.register_file_current.copy()
+    state.register_file_previous = state.register_file_current[:]
 
     # ========================================================================
     # Warmup: Fill pipeline with NOPs to synchronize expected value queues
@@ -173,7 +181,7 @@ async def test_random_riscv_regression_main(
     for warmup_cycle in range(PIPELINE_DEPTH):
         # Queue expected outputs for NOP (no register change, sequential PC)
         state.register_file_current_expected_queue.append(
-            state.register_file_current.copy()
+            state.register_file_current[:]
         )
         expected_pc = (state.program_counter_current + 4) & MASK32
         state.program_counter_expected_values_queue.append(expected_pc)
@@ -275,7 +283,7 @@ async def test_random_riscv_regression_main(
 
         # Queue expected results for monitors to verify when they emerge from pipeline
         state.register_file_current_expected_queue.append(
-            state.register_file_current.copy()
+            state.register_file_current[:]
         )
         state.program_counter_expected_values_queue.append(expected_pc)
 
@@ -296,8 +304,8 @@ async def test_random_riscv_regression_main(
                 writeback_value=rd_wb_value,
                 source_register_1=rs1,
                 source_register_2=rs2,
-                immediate=imm if operation not in (R_ALU | BRANCHES | JUMPS) else None,
-                address=addr if operation in (LOADS | STORES) else None,
+                immediate=imm if operation not in _NO_IMMEDIATE_OPS else None,
+                address=addr if operation in _MEMORY_OPS else None,
                 branch_taken=state.branch_taken_current
                 if operation in BRANCHES
                 else None,
@@ -433,7 +441,7 @@ async def test_random_riscv_regression_with_fp_main(
     state.csr_cycle_counter = reset_cycle_count - config.reset_cycles
 
     # Initialize register files AFTER reset
-    state.register_file_current = dut_if.initialize_registers()
+    state.register_file_current = array("I", dut_if.initialize_registers())
     # Initialize FP register file to 0 (ensures test isolation between tests)
     state.fp_register_file_current = dut_if.initialize_fp_registers()
 
@@ -454,7 +462,7 @@ async def test_random_riscv_regression_with_fp_main(
     )
 
     # Initialize register file state for first instruction
-    state.register_file_previous = state.register_file_current.copy()
+    state.register_file_previous = state.register_file_current[:]
     state.fp_register_file_previous = state.fp_register_file_current.copy()
 
     # ========================================================================
@@ -578,10 +586,10 @@ async def test_random_riscv_regression_with_fp_main(
                 f"rs1 {rs1}, rs2 {rs2}, "
                 f"wb_value 0x{rd_wb_value:08X} to {dest_type}{rd_to_update}"
             )
-            if operation in (LOADS | FP_LOADS):
+            if operation in _ALL_LOAD_OPS:
                 addr = (state.register_file_previous[rs1] + imm) & MASK32
                 cocotb.log.info(f"cycle {cycle} loading from address 0x{addr:08X}")
-            if operation in (STORES | FP_STORES):
+            if operation in _ALL_STORE_OPS:
                 addr = (state.register_file_previous[rs1] + imm) & MASK32
                 cocotb.log.info(f"cycle {cycle} storing to address 0x{addr:08X}")
 
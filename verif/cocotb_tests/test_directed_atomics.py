@@ -53,15 +53,17 @@ Usage:
 """
 
 import cocotb
+import logging
 from cocotb.clock import Clock
 from cocotb.triggers import RisingEdge, FallingEdge
 from typing import Any
 
-from config import MASK32, PIPELINE_DEPTH
+from config import MASK32, NOP_INSTRUCTION, PIPELINE_DEPTH
+from encoders.op_tables import AMO_LR_SC, STORES
 from models.memory_model import MemoryModel
 from cocotb_tests.test_helpers import DUTInterface
 from cocotb_tests.test_state import TestState
-from cocotb_tests.test_common import TestConfig, execute_nop
+from cocotb_tests.test_common import TestConfig, drive_nops, execute_nop
 
 
 async def execute_lr_sc_instruction(
@@ -96,8 +98,6 @@ async def execute_lr_sc_instruction(
         expected_rd_value: Expected value written to rd
         expected_sc_success: For SC.W, whether it should succeed (None for LR.W)
     """
-    from encoders.op_tables import AMO_LR_SC
-
     # Wait for DUT ready
     await FallingEdge(dut_if.clock)
     await dut_if.wait_ready()
@@ -120,9 +120,14 @@ async def execute_lr_sc_instruction(
         state.set_reservation(address)
         writeback_value = expected_rd_value
         cocotb.log.info(
-            f"LR.W x{rd}, (x{rs1}): addr=0x{address:08X}, "
-            f"loaded=0x{writeback_value:08X}, reservation set, queue_before={queue_len}, "
-            f"instr=0x{instr:08X}"
+            "LR.W x%d, (x%d): addr=0x%08X, loaded=0x%08X, reservation set, "
+            "queue_before=%d, instr=0x%08X",
+            rd,
+            rs1,
+            address,
+            writeback_value,
+            queue_len,
+            instr,
         )
     else:
         # SC.W: check reservation, conditionally store
@@ -137,13 +142,20 @@ async def execute_lr_sc_instruction(
             state.memory_write_data_expected_queue.append(write_data)
             mem_model.write_word(address, write_data)
             cocotb.log.info(
-                f"SC.W x{rd}, x{rs2}, (x{rs1}): addr=0x{address:08X}, "
-                f"data=0x{write_data:08X}, SUCCESS (rd=0)"
+                "SC.W x%d, x%d, (x%d): addr=0x%08X, data=0x%08X, SUCCESS (rd=0)",
+                rd,
+                rs2,
+                rs1,
+                address,
+                write_data,
             )
         else:
             cocotb.log.info(
-                f"SC.W x{rd}, x{rs2}, (x{rs1}): addr=0x{address:08X}, "
-                f"FAILED (rd=1, no write)"
+                "SC.W x%d, x%d, (x%d): addr=0x%08X, FAILED (rd=1, no write)",
+                rd,
+                rs2,
+                rs1,
+                address,
             )
 
         # Track SC result for verification
@@ -156,9 +168,7 @@ async def execute_lr_sc_instruction(
         state.register_file_current[rd] = writeback_value & MASK32
 
     # Queue expected outputs
-    state.register_file_current_expected_queue.append(
-        state.register_file_current.copy()
-    )
+    state.register_file_current_expected_queue.append(state.register_file_current[:])
     expected_pc = (state.program_counter_current + 4) & MASK32
     state.program_counter_expected_values_queue.append(expected_pc)
 
@@ -193,8 +203,6 @@ async def execute_store(
         rs2: Data register
         imm: Immediate offset (default 0)
     """
-    from encoders.op_tables import STORES
-
     await FallingEdge(dut_if.clock)
     await dut_if.wait_ready()
 
@@ -213,13 +221,11 @@ async def execute_store(
     mem_model.write_word(address, write_data)
 
     cocotb.log.info(
-        f"SW x{rs2}, {imm}(x{rs1}): addr=0x{address:08X}, data=0x{write_data:08X}"
+        "SW x%d, %d(x%d): addr=0x%08X, data=0x%08X", rs2, imm, rs1, address, write_data
     )
 
     # Queue expected outputs (no register change for store)
-    state.register_file_current_expected_queue.append(
-        state.register_file_current.copy()
-    )
+    state.register_file_current_expected_queue.append(state.register_file_current[:])
     expected_pc = (state.program_counter_current + 4) & MASK32
     state.program_counter_expected_values_queue.append(expected_pc)
 
@@ -261,7 +267,7 @@ async def run_directed_lr_sc_test(dut: Any, config: TestConfig | None = None) ->
     state = TestState()
 
     # Initialize DUT signals
-    dut_if.instruction = 0x00000013  # 32-bit NOP (addi x0, x0, 0)
+    dut_if.instruction = NOP_INSTRUCTION
 
     # Set up specific register values for testing
     # Use word-aligned addresses in the initialized memory region
@@ -275,7 +281,6 @@ async def run_directed_lr_sc_test(dut: Any, config: TestConfig | None = None) ->
     test_value_2 = 0x87654321  # Initial value for addr2
 
     # Initialize all registers to known values (not random for directed test)
-    state.register_file_current = [0] * 32
     for i in range(1, 32):
         state.register_file_current[i] = (i * 0x01010101) & MASK32  # Predictable values
 
@@ -313,7 +318,7 @@ async def run_directed_lr_sc_test(dut: Any, config: TestConfig | None = None) ->
     )
 
     # Initialize register file pipeline states for 6-stage pipeline.
-    state.register_file_previous = state.register_file_current.copy()
+    state.register_file_previous = state.register_file_current[:]
 
     # ========================================================================
     # Warmup: Let pipeline drain and sync expected queues
@@ -321,7 +326,9 @@ async def run_directed_lr_sc_test(dut: Any, config: TestConfig | None = None) ->
     cocotb.log.info("=== Warming up pipeline ===")
     for i in range(8):  # More than pipeline depth to ensure sync
         cocotb.log.info(
-            f"Warmup NOP {i}: queue_len={len(state.register_file_current_expected_queue)}"
+            "Warmup NOP %d: queue_len=%d",
+            i,
+            len(state.register_file_current_expected_queue),
         )
         await execute_nop(dut_if, state)
 
@@ -337,23 +344,30 @@ async def run_directed_lr_sc_test(dut: Any, config: TestConfig | None = None) ->
 
     # Wait for stores to complete through pipeline before reading
     cocotb.log.info("=== Waiting for stores to complete ===")
-    for _ in range(PIPELINE_DEPTH):
-        await execute_nop(dut_if, state)
+    await drive_nops(dut_if, state, PIPELINE_DEPTH)
 
     # Debug: Check what's in the DUT's memory after stores
-    word_addr_1 = test_address_1 >> 2  # Convert byte address to word address
-    word_addr_2 = test_address_2 >> 2
-    try:
-        mem_val_1 = int(dut.data_memory_for_simulation.memory[word_addr_1].value)
-        mem_val_2 = int(dut.data_memory_for_simulation.memory[word_addr_2].value)
-        cocotb.log.info(
-            f"DEBUG: DUT memory[{word_addr_1}] (addr 0x{test_address_1:08X}) = 0x{mem_val_1:08X}"
-        )
-        cocotb.log.info(
-            f"DEBUG: DUT memory[{word_addr_2}] (addr 0x{test_address_2:08X}) = 0x{mem_val_2:08X}"
-        )
-    except Exception as e:
-        cocotb.log.warning(f"DEBUG: Could not read DUT memory: {e}")
+    # (skipped entirely unless DEBUG logging is enabled)
+    if cocotb.log.isEnabledFor(logging.DEBUG):
+        word_addr_1 = test_address_1 >> 2  # Convert byte address to word address
+        word_addr_2 = test_address_2 >> 2
+        try:
+            mem_val_1 = int(dut.data_memory_for_simulation.memory[word_addr_1].value)
+            mem_val_2 = int(dut.data_memory_for_simulation.memory[word_addr_2].value)
+            cocotb.log.debug(
+                "DUT memory[%d] (addr 0x%08X) = 0x%08X",
+                word_addr_1,
+                test_address_1,
+                mem_val_1,
+            )
+            cocotb.log.debug(
+                "DUT memory[%d] (addr 0x%08X) = 0x%08X",
+                word_addr_2,
+                test_address_2,
+                mem_val_2,
+            )
+        except Exception as e:
+            cocotb.log.warning("Could not read DUT memory: %s", e)
 
     # ========================================================================
     # Test Case 1: LR.W + SC.W Success (same address)
@@ -374,14 +388,11 @@ async def run_directed_lr_sc_test(dut: Any, config: TestConfig | None = None) ->
     )
 
     # Wait for LR.W to complete through pipeline
-    for _ in range(PIPELINE_DEPTH + 4):
-        await execute_nop(dut_if, state)
+    await drive_nops(dut_if, state, PIPELINE_DEPTH + 4)
 
     # Check x5 after LR.W
     x5_value = dut_if.read_register(5)
-    cocotb.log.info(
-        f"DEBUG: After LR.W + NOPs, x5 = 0x{x5_value:08X} (expected 0x12345678)"
-    )
+    cocotb.log.debug("After LR.W + NOPs, x5 = 0x%08X (expected 0x12345678)", x5_value)
     assert (
         x5_value == 0x12345678
     ), f"LR.W failed: x5 = 0x{x5_value:08X}, expected 0x12345678"
@@ -401,13 +412,12 @@ async def run_directed_lr_sc_test(dut: Any, config: TestConfig | None = None) ->
     )
 
     # Verify SC.W result after pipeline flush
-    for _ in range(PIPELINE_DEPTH):
-        await execute_nop(dut_if, state)
+    await drive_nops(dut_if, state, PIPELINE_DEPTH)
     x6_value = dut_if.read_register(6)
     assert (
         x6_value == 0
     ), f"SC.W Test Case 1 failed: x6 = {x6_value}, expected 0 (success)"
-    cocotb.log.info(f"SC.W x6 = {x6_value} (success)")
+    cocotb.log.info("SC.W x6 = %d (success)", x6_value)
 
     # ========================================================================
     # Test Case 2: SC.W without LR.W (should fail)
@@ -428,13 +438,12 @@ async def run_directed_lr_sc_test(dut: Any, config: TestConfig | None = None) ->
     )
 
     # Verify SC.W failure
-    for _ in range(PIPELINE_DEPTH):
-        await execute_nop(dut_if, state)
+    await drive_nops(dut_if, state, PIPELINE_DEPTH)
     x7_value = dut_if.read_register(7)
     assert (
         x7_value == 1
     ), f"SC.W Test Case 2 failed: x7 = {x7_value}, expected 1 (failure)"
-    cocotb.log.info(f"SC.W x7 = {x7_value} (failed as expected)")
+    cocotb.log.info("SC.W x7 = %d (failed as expected)", x7_value)
 
     # ========================================================================
     # Test Case 3: LR.W + SC.W to different address (should fail)
@@ -468,13 +477,12 @@ async def run_directed_lr_sc_test(dut: Any, config: TestConfig | None = None) ->
     )
 
     # Verify SC.W failure due to address mismatch
-    for _ in range(PIPELINE_DEPTH):
-        await execute_nop(dut_if, state)
+    await drive_nops(dut_if, state, PIPELINE_DEPTH)
     x9_value = dut_if.read_register(9)
     assert (
         x9_value == 1
     ), f"SC.W Test Case 3 failed: x9 = {x9_value}, expected 1 (failure)"
-    cocotb.log.info(f"SC.W x9 = {x9_value} (failed due to address mismatch)")
+    cocotb.log.info("SC.W x9 = %d (failed due to address mismatch)", x9_value)
 
     # ========================================================================
     # Test Case 4: Back-to-back LR.W/SC.W (pipeline forwarding test)
@@ -508,13 +516,12 @@ async def run_directed_lr_sc_test(dut: Any, config: TestConfig | None = None) ->
     )
 
     # Verify back-to-back SC.W success
-    for _ in range(PIPELINE_DEPTH):
-        await execute_nop(dut_if, state)
+    await drive_nops(dut_if, state, PIPELINE_DEPTH)
     x14_value = dut_if.read_register(14)
     assert (
         x14_value == 0
     ), f"SC.W Test Case 4 failed: x14 = {x14_value}, expected 0 (success)"
-    cocotb.log.info(f"SC.W x14 = {x14_value} (back-to-back success via forwarding)")
+    cocotb.log.info("SC.W x14 = %d (back-to-back success via forwarding)", x14_value)
 
     # ========================================================================
     # Test Case 5: LR.W + intervening NOPs + SC.W (reservation persists)
@@ -535,8 +542,7 @@ async def run_directed_lr_sc_test(dut: Any, config: TestConfig | None = None) ->
     )
 
     # Insert a few NOPs (addi x0, x0, 0)
-    for _ in range(3):
-        await execute_nop(dut_if, state)
+    await drive_nops(dut_if, state, 3)
 
     # SC.W x16, x12, (x10) - should still succeed
     await execute_lr_sc_instruction(
@@ -552,20 +558,18 @@ async def run_directed_lr_sc_test(dut: Any, config: TestConfig | None = None) ->
     )
 
     # Verify SC.W success after intervening NOPs
-    for _ in range(PIPELINE_DEPTH):
-        await execute_nop(dut_if, state)
+    await drive_nops(dut_if, state, PIPELINE_DEPTH)
     x16_value = dut_if.read_register(16)
     assert (
         x16_value == 0
     ), f"SC.W Test Case 5 failed: x16 = {x16_value}, expected 0 (success)"
-    cocotb.log.info(f"SC.W x16 = {x16_value} (success after NOPs)")
+    cocotb.log.info("SC.W x16 = %d (success after NOPs)", x16_value)
 
     # ========================================================================
     # Cleanup: Flush pipeline with NOPs
     # ========================================================================
     cocotb.log.info("=== Flushing pipeline ===")
-    for _ in range(10):
-        await execute_nop(dut_if, state)
+    await drive_nops(dut_if, state, 10)
 
     cocotb.log.info("=== All LR.W/SC.W directed tests passed! ===")
 
@@ -26,6 +26,7 @@ the pipeline correctly handles the case where:
 """
 
 import cocotb
+from array import array
 from cocotb.clock import Clock
 from cocotb.triggers import RisingEdge, FallingEdge
 from typing import Any
@@ -78,9 +79,7 @@ async def execute_instruction(
 
     # Queue expected outputs
     expected_pc = (state.program_counter_current + 4) & MASK32
-    state.register_file_current_expected_queue.append(
-        state.register_file_current.copy()
-    )
+    state.register_file_current_expected_queue.append(state.register_file_current[:])
     if use_fp_monitor:
         state.fp_register_file_current_expected_queue.append(
             state.fp_register_file_current.copy()
@@ -122,7 +121,7 @@ async def setup_test(dut: Any, use_fp_monitor: bool = False) -> tuple:
     state.csr_cycle_counter = reset_cycles - config.reset_cycles
 
     # Initialize register files AFTER reset
-    state.register_file_current = dut_if.initialize_registers()
+    state.register_file_current = array("I", dut_if.initialize_registers())
     if use_fp_monitor:
         state.fp_register_file_current = dut_if.initialize_fp_registers()
 
@@ -144,7 +143,7 @@ async def setup_test(dut: Any, use_fp_monitor: bool = False) -> tuple:
     )
 
     # Initialize previous state
-    state.register_file_previous = state.register_file_current.copy()
+    state.register_file_previous = state.register_file_current[:]
     state.fp_register_file_previous = state.fp_register_file_current.copy()
 
     # Warmup pipeline with NOPs (matches test_cpu.py warmup pattern exactly)
@@ -152,7 +151,7 @@ async def setup_test(dut: Any, use_fp_monitor: bool = False) -> tuple:
     for warmup_cycle in range(PIPELINE_DEPTH):
         # Queue expected outputs for NOP (no register change, sequential PC)
         state.register_file_current_expected_queue.append(
-            state.register_file_current.copy()
+            state.register_file_current[:]
         )
         if use_fp_monitor:
             state.fp_register_file_current_expected_queue.append(
@@ -191,7 +190,7 @@ async def drain_pipeline(
 
         # Queue expected outputs
         state.register_file_current_expected_queue.append(
-            state.register_file_current.copy()
+            state.register_file_current[:]
         )
         if use_fp_monitor:
             state.fp_register_file_current_expected_queue.append(
@@ -98,7 +98,6 @@ async def run_directed_trap_test(dut: Any, config: TestConfig | None = None) ->
     dut_if.instruction = 0x00000013  # 32-bit NOP (addi x0, x0, 0)
 
     # Initialize registers to known values
-    state.register_file_current = [0] * 32
     for i in range(1, 32):
         state.register_file_current[i] = (i * 0x11111111) & MASK32
 
@@ -126,7 +125,7 @@ async def run_directed_trap_test(dut: Any, config: TestConfig | None = None) ->
     )
 
     # Initialize register file pipeline states for 6-stage pipeline.
-    state.register_file_previous = state.register_file_current.copy()
+    state.register_file_previous = state.register_file_current[:]
 
     # ========================================================================
     # Warmup: Let pipeline stabilize
@@ -151,9 +150,7 @@ async def run_directed_trap_test(dut: Any, config: TestConfig | None = None) ->
     await RisingEdge(dut_if.clock)
 
     # Track state
-    state.register_file_current_expected_queue.append(
-        state.register_file_current.copy()
-    )
+    state.register_file_current_expected_queue.append(state.register_file_current[:])
     expected_pc = (state.program_counter_current + 4) & MASK32
     state.program_counter_expected_values_queue.append(expected_pc)
     state.update_program_counter(expected_pc)
@@ -183,9 +180,7 @@ async def run_directed_trap_test(dut: Any, config: TestConfig | None = None) ->
 
     # After ECALL, PC should jump to mtvec (trap_handler_address)
     # mepc should contain ecall_pc, mcause should be 11 (ECALL from M-mode)
-    state.register_file_current_expected_queue.append(
-        state.register_file_current.copy()
-    )
+    state.register_file_current_expected_queue.append(state.register_file_current[:])
     # Note: The expected PC after ECALL is complex due to pipeline flush
     # For now, we'll just track state and verify via register reads
     state.program_counter_expected_values_queue.append(trap_handler_address)
@@ -214,9 +209,7 @@ async def run_directed_trap_test(dut: Any, config: TestConfig | None = None) ->
 
     # x2 should get mepc value (ecall_pc adjusted for pipeline)
     # We'll verify this after pipeline drains
-    state.register_file_current_expected_queue.append(
-        state.register_file_current.copy()
-    )
+    state.register_file_current_expected_queue.append(state.register_file_current[:])
     expected_pc = (state.program_counter_current + 4) & MASK32
     state.program_counter_expected_values_queue.append(expected_pc)
     state.update_program_counter(expected_pc)
@@ -238,9 +231,7 @@ async def run_directed_trap_test(dut: Any, config: TestConfig | None = None) ->
     dut_if.instruction = instr_read_mcause
     await RisingEdge(dut_if.clock)
 
-    state.register_file_current_expected_queue.append(
-        state.register_file_current.copy()
-    )
+    state.register_file_current_expected_queue.append(state.register_file_current[:])
     expected_pc = (state.program_counter_current + 4) & MASK32
     state.program_counter_expected_values_queue.append(expected_pc)
     state.update_program_counter(expected_pc)
@@ -272,9 +263,7 @@ async def run_directed_trap_test(dut: Any, config: TestConfig | None = None) ->
     await RisingEdge(dut_if.clock)
 
     # After MRET, PC should return to mepc
-    state.register_file_current_expected_queue.append(
-        state.register_file_current.copy()
-    )
+    state.register_file_current_expected_queue.append(state.register_file_current[:])
     # PC goes to mepc value
     state.program_counter_expected_values_queue.append(mepc_value)
     state.update_program_counter(mepc_value)
@@ -297,9 +286,7 @@ async def run_directed_trap_test(dut: Any, config: TestConfig | None = None) ->
     dut_if.instruction = instr_csrrw_mtvec  # Re-use the CSRRW instruction
     await RisingEdge(dut_if.clock)
 
-    state.register_file_current_expected_queue.append(
-        state.register_file_current.copy()
-    )
+    state.register_file_current_expected_queue.append(state.register_file_current[:])
     expected_pc = (state.program_counter_current + 4) & MASK32
     state.program_counter_expected_values_queue.append(expected_pc)
     state.update_program_counter(expected_pc)
@@ -318,9 +305,7 @@ async def run_directed_trap_test(dut: Any, config: TestConfig | None = None) ->
     dut_if.instruction = instr_ebreak
     await RisingEdge(dut_if.clock)
 
-    state.register_file_current_expected_queue.append(
-        state.register_file_current.copy()
-    )
+    state.register_file_current_expected_queue.append(state.register_file_current[:])
     state.program_counter_expected_values_queue.append(trap_handler_address)
     state.update_program_counter(trap_handler_address)
     state.advance_register_state()
@@ -336,9 +321,7 @@ async def run_directed_trap_test(dut: Any, config: TestConfig | None = None) ->
     dut_if.instruction = instr_read_mcause
     await RisingEdge(dut_if.clock)
 
-    state.register_file_current_expected_queue.append(
-        state.register_file_current.copy()
-    )
+    state.register_file_current_expected_queue.append(state.register_file_current[:])
     expected_pc = (state.program_counter_current + 4) & MASK32
     state.program_counter_expected_values_queue.append(expected_pc)
     state.update_program_counter(expected_pc)
@@ -358,9 +341,7 @@ async def run_directed_trap_test(dut: Any, config: TestConfig | None = None) ->
     dut_if.instruction = instr_mret
     await RisingEdge(dut_if.clock)
 
-    state.register_file_current_expected_queue.append(
-        state.register_file_current.copy()
-    )
+    state.register_file_current_expected_queue.append(state.register_file_current[:])
     state.program_counter_expected_values_queue.append(0)  # Will be mepc
     state.update_program_counter(0)
     state.advance_register_state()
@@ -418,7 +399,6 @@ async def run_directed_interrupt_trap_test(
     dut_if.instruction = 0x00000013  # 32-bit NOP (addi x0, x0, 0)
 
     # Initialize registers
-    state.register_file_current = [0] * 32
     for i in range(1, 32):
         state.register_file_current[i] = (i * 0x11111111) & MASK32
 
@@ -448,7 +428,7 @@ async def run_directed_interrupt_trap_test(
     )
 
     # Initialize register file pipeline states for 6-stage pipeline.
-    state.register_file_previous = state.register_file_current.copy()
+    state.register_file_previous = state.register_file_current[:]
 
     # ========================================================================
     # Warmup
@@ -470,9 +450,7 @@ async def run_directed_interrupt_trap_test(
     dut_if.instruction = instr_csrrw_mtvec
     await RisingEdge(dut_if.clock)
 
-    state.register_file_current_expected_queue.append(
-        state.register_file_current.copy()
-    )
+    state.register_file_current_expected_queue.append(state.register_file_current[:])
     expected_pc = (state.program_counter_current + 4) & MASK32
     state.program_counter_expected_values_queue.append(expected_pc)
     state.update_program_counter(expected_pc)
@@ -496,9 +474,7 @@ async def run_directed_interrupt_trap_test(
     dut_if.instruction = instr_csrrw_mie
     await RisingEdge(dut_if.clock)
 
-    state.register_file_current_expected_queue.append(
-        state.register_file_current.copy()
-    )
+    state.register_file_current_expected_queue.append(state.register_file_current[:])
     expected_pc = (state.program_counter_current + 4) & MASK32
     state.program_counter_expected_values_queue.append(expected_pc)
     state.update_program_counter(expected_pc)
@@ -522,9 +498,7 @@ async def run_directed_interrupt_trap_test(
     dut_if.instruction = instr_csrrw_mstatus
     await RisingEdge(dut_if.clock)
 
-    state.register_file_current_expected_queue.append(
-        state.register_file_current.copy()
-    )
+    state.register_file_current_expected_queue.append(state.register_file_current[:])
     expected_pc = (state.program_counter_current + 4) & MASK32
     state.program_counter_expected_values_queue.append(expected_pc)
     state.update_program_counter(expected_pc)
@@ -687,7 +661,6 @@ async def run_directed_mret_interrupt_race_test(
     dut_if.instruction = 0x00000013  # 32-bit NOP (addi x0, x0, 0)
 
     # Initialize registers
-    state.register_file_current = [0] * 32
     for i in range(1, 32):
         state.register_file_current[i] = (i * 0x11111111) & MASK32
 
@@ -713,7 +686,7 @@ async def run_directed_mret_interrupt_race_test(
     )
 
     # Initialize register file pipeline states for 6-stage pipeline.
-    state.register_file_previous = state.register_file_current.copy()
+    state.register_file_previous = state.register_file_current[:]
 
     # Warmup
     cocotb.log.info("=== Warming up pipeline ===")
@@ -728,9 +701,7 @@ async def run_directed_mret_interrupt_race_test(
     await dut_if.wait_ready()
     dut_if.instruction = instr_csrrw_mtvec
     await RisingEdge(dut_if.clock)
-    state.register_file_current_expected_queue.append(
-        state.register_file_current.copy()
-    )
+    state.register_file_current_expected_queue.append(state.register_file_current[:])
     expected_pc = (state.program_counter_current + 4) & MASK32
     state.program_counter_expected_values_queue.append(expected_pc)
     state.update_program_counter(expected_pc)
@@ -746,9 +717,7 @@ async def run_directed_mret_interrupt_race_test(
     await dut_if.wait_ready()
     dut_if.instruction = instr_csrrw_mepc
     await RisingEdge(dut_if.clock)
-    state.register_file_current_expected_queue.append(
-        state.register_file_current.copy()
-    )
+    state.register_file_current_expected_queue.append(state.register_file_current[:])
     expected_pc = (state.program_counter_current + 4) & MASK32
     state.program_counter_expected_values_queue.append(expected_pc)
     state.update_program_counter(expected_pc)
@@ -764,9 +733,7 @@ async def run_directed_mret_interrupt_race_test(
     await dut_if.wait_ready()
     dut_if.instruction = instr_csrrw_mie
     await RisingEdge(dut_if.clock)
-    state.register_file_current_expected_queue.append(
-        state.register_file_current.copy()
-    )
+    state.register_file_current_expected_queue.append(state.register_file_current[:])
     expected_pc = (state.program_counter_current + 4) & MASK32
     state.program_counter_expected_values_queue.append(expected_pc)
     state.update_program_counter(expected_pc)
@@ -782,9 +749,7 @@ async def run_directed_mret_interrupt_race_test(
     await dut_if.wait_ready()
     dut_if.instruction = instr_csrrw_mstatus
     await RisingEdge(dut_if.clock)
-    state.register_file_current_expected_queue.append(
-        state.register_file_current.copy()
-    )
+    state.register_file_current_expected_queue.append(state.register_file_current[:])
     expected_pc = (state.program_counter_current + 4) & MASK32
     state.program_counter_expected_values_queue.append(expected_pc)
     state.update_program_counter(expected_pc)
@@ -905,7 +870,6 @@ async def run_directed_csrsi_enable_mie_test(
     dut_if.instruction = 0x00000013  # 32-bit NOP (addi x0, x0, 0)
 
     # Initialize registers
-    state.register_file_current = [0] * 32
     for i in range(1, 32):
         state.register_file_current[i] = (i * 0x11111111) & MASK32
 
@@ -928,7 +892,7 @@ async def run_directed_csrsi_enable_mie_test(
     )
 
     # Initialize register file pipeline states for 6-stage pipeline.
-    state.register_file_previous = state.register_file_current.copy()
+    state.register_file_previous = state.register_file_current[:]
 
     # Warmup
     cocotb.log.info("=== Warming up pipeline ===")
@@ -943,9 +907,7 @@ async def run_directed_csrsi_enable_mie_test(
     await dut_if.wait_ready()
     dut_if.instruction = instr_csrrw_mtvec
     await RisingEdge(dut_if.clock)
-    state.register_file_current_expected_queue.append(
-        state.register_file_current.copy()
-    )
+    state.register_file_current_expected_queue.append(state.register_file_current[:])
     expected_pc = (state.program_counter_current + 4) & MASK32
     state.program_counter_expected_values_queue.append(expected_pc)
     state.update_program_counter(expected_pc)
@@ -961,9 +923,7 @@ async def run_directed_csrsi_enable_mie_test(
     await dut_if.wait_ready()
     dut_if.instruction = instr_csrrw_mie
     await RisingEdge(dut_if.clock)
-    state.register_file_current_expected_queue.append(
-        state.register_file_current.copy()
-    )
+    state.register_file_current_expected_queue.append(state.register_file_current[:])
     expected_pc = (state.program_counter_current + 4) & MASK32
     state.program_counter_expected_values_queue.append(expected_pc)
     state.update_program_counter(expected_pc)
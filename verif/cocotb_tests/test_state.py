@@ -47,7 +47,12 @@ Queue Management:
     when hardware signals indicate valid output.
 """
 
+from array import array
+from collections import deque
+from collections.abc import Sequence
+
 from config import (
+    INSTRUCTION_SIZE_BYTES,
     MASK32,
     PIPELINE_IF_TO_EX_CYCLES,
     PIPELINE_IF_TO_MA_CYCLES,
@@ -98,8 +103,10 @@ class TestState:
         # instructions via forwarding paths (EX→ID, MA→ID, WB→ID).
         # 'previous' = values visible to current instruction (for operand reads)
         # 'current' = values after writeback of current instruction
-        self.register_file_current: list[int] = [0] * 32
-        self.register_file_previous: list[int] = [0] * 32
+        # Stored as unsigned 32-bit arrays so per-instruction snapshots are a
+        # single contiguous copy rather than 32 boxed ints.
+        self.register_file_current: array[int] = array("I", [0] * 32)
+        self.register_file_previous: array[int] = array("I", [0] * 32)
 
         # ====================================================================
         # FP Register File State (F extension)
@@ -149,11 +156,12 @@ class TestState:
         # ====================================================================
         # Expected Output Queues
         # ====================================================================
-        self.register_file_current_expected_queue: list[list[int]] = []
-        self.fp_register_file_current_expected_queue: list[list[int]] = []
-        self.program_counter_expected_values_queue: list[int] = []
-        self.memory_write_data_expected_queue: list[int] = []
-        self.memory_write_address_expected_queue: list[int] = []
+        # FIFOs: the test appends on the right, monitors popleft() in O(1)
+        self.register_file_current_expected_queue: deque[Sequence[int]] = deque()
+        self.fp_register_file_current_expected_queue: deque[list[int]] = deque()
+        self.program_counter_expected_values_queue: deque[int] = deque()
+        self.memory_write_data_expected_queue: deque[int] = deque()
+        self.memory_write_address_expected_queue: deque[int] = deque()
 
     # ========================================================================
     # Convenience Properties
@@ -200,7 +208,7 @@ class TestState:
 
     def advance_register_state(self) -> None:
         """Advance both integer and FP register state: current becomes previous."""
-        self.register_file_previous = self.register_file_current.copy()
+        self.register_file_previous = self.register_file_current[:]
         self.fp_register_file_previous = self.fp_register_file_current.copy()
 
     def queue_expected_outputs(self, expected_pc: int) -> None:
@@ -209,14 +217,55 @@ class TestState:
         Args:
             expected_pc: Expected program counter value
         """
-        self.register_file_current_expected_queue.append(
-            self.register_file_current.copy()
-        )
+        self.register_file_current_expected_queue.append(self.register_file_current[:])
         self.fp_register_file_current_expected_queue.append(
             self.fp_register_file_current.copy()
         )
         self.program_counter_expected_values_queue.append(expected_pc)
 
+    def queue_nop_expectations(self, count: int) -> Sequence[int]:
+        """Queue expected outputs for ``count`` back-to-back NOPs.
+
+        Equivalent to the queueing half of ``count`` per-instruction NOPs: an
+        unchanged register snapshot (a separate copy per entry) and the next
+        sequential PC for each NOP. Call before the NOPs are clocked so the
+        queues are already populated while the run executes.
+
+        Args:
+            count: Number of NOPs about to be driven
+
+        Returns:
+            The queued expected PCs, to pass to :meth:`retire_nops`
+        """
+        register_snapshot = self.register_file_current
+        self.register_file_current_expected_queue.extend(
+            register_snapshot[:] for _ in range(count)
+        )
+
+        step = INSTRUCTION_SIZE_BYTES
+        base = self.program_counter_current
+        last = base + step * count
+        if last <= MASK32:
+            # No wraparound: the PC run is a plain arithmetic sequence
+            expected_pcs: Sequence[int] = range(base + step, last + step, step)
+        else:
+            expected_pcs = [(base + step * i) & MASK32 for i in range(1, count + 1)]
+        self.program_counter_expected_values_queue.extend(expected_pcs)
+        return expected_pcs
+
+    def retire_nops(self, expected_pcs: Sequence[int]) -> None:
+        """Advance PC stages and counters once a queued NOP run has executed.
+
+        Args:
+            expected_pcs: Expected PCs returned by :meth:`queue_nop_expectations`
+        """
+        # Only the last three PCs survive the stage shift
+        for expected_pc in expected_pcs[-3:]:
+            self.update_program_counter(expected_pc)
+
+        self.csr_cycle_counter += len(expected_pcs)
+        self.csr_instret_counter += len(expected_pcs)
+
     def has_pending_expectations(self) -> bool:
         """Check if there are still expected values waiting to be verified."""
         return (
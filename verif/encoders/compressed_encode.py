@@ -29,6 +29,8 @@ Register Mapping:
     Compressed instructions use 3-bit register fields that map to x8-x15:
     - rd' = {2'b01, 3-bit-field} (i.e., add 8 to the 3-bit value)
     - This covers s0-s1 (x8-x9) and a0-a5 (x10-x15)
+    - Since x8-x15 are 0b01xxx, the encoders range-check with
+      ``(reg ^ 8) & ~0x7 == 0`` and take the field as ``reg & 0x7``
 
 Example Usage:
     >>> # Encode C.ADDI x10, 5
@@ -41,58 +43,68 @@ Note:
     for packing these into 32-bit words based on PC alignment.
 """
 
-from dataclasses import dataclass
+from functools import cache
 
 
-@dataclass
-class CompressedEncoder:
-    """Base class for compressed instruction encoding."""
+def is_compressible_reg(reg: int) -> bool:
+    """Check if register can be used in compressed instructions.
 
-    @staticmethod
-    def _pack_bits(*fields: tuple[int, int, int]) -> int:
-        """Pack bit fields into 16-bit instruction word.
+    Args:
+        reg: Register index (0-31)
 
-        Args:
-            fields: Variable number of tuples, each containing:
-                - value: The value to insert
-                - position: Bit position (LSB) where field starts
-                - mask: Bit mask for the field width
+    Returns:
+        True if register is x8-x15 (compressible)
+    """
+    return 8 <= reg <= 15
 
-        Returns:
-            16-bit packed instruction word
-        """
-        result = 0
-        for value, position, mask in fields:
-            result |= (value & mask) << position
-        return result
 
+def _cj_imm_bits(imm12: int) -> int:
+    """Scatter a 12-bit jump offset into its CJ-format bit positions.
 
-def compress_reg(reg: int) -> int:
-    """Convert full register index (8-15) to compressed 3-bit field.
+    Shared by C.JAL and C.J, which differ only in funct3.
 
     Args:
-        reg: Register index (must be 8-15 for compressed encoding)
+        imm12: Jump offset masked to 12 bits
 
     Returns:
-        3-bit compressed register field
-
-    Raises:
-        AssertionError: If register is not in range 8-15
+        imm[11|4|9:8|10|6|7|3:1|5] placed in bits [12:2]
     """
-    assert 8 <= reg <= 15, f"Compressed register must be x8-x15, got x{reg}"
-    return reg - 8
+    return (
+        ((imm12 & 0x800) << 1)  # imm[11] -> bit [12]
+        | ((imm12 & 0x10) << 7)  # imm[4] -> bit [11]
+        | ((imm12 & 0x300) << 1)  # imm[9:8] -> bits [10:9]
+        | ((imm12 & 0x400) >> 2)  # imm[10] -> bit [8]
+        | ((imm12 & 0x40) << 1)  # imm[6] -> bit [7]
+        | ((imm12 & 0x80) >> 1)  # imm[7] -> bit [6]
+        | ((imm12 & 0xE) << 2)  # imm[3:1] -> bits [5:3]
+        | ((imm12 & 0x20) >> 3)  # imm[5] -> bit [2]
+    )
 
 
-def is_compressible_reg(reg: int) -> bool:
-    """Check if register can be used in compressed instructions.
+def _cb_imm_bits(imm9: int) -> int:
+    """Scatter a 9-bit branch offset into its CB-format bit positions.
+
+    Shared by C.BEQZ and C.BNEZ, which differ only in funct3.
 
     Args:
-        reg: Register index (0-31)
+        imm9: Branch offset masked to 9 bits
 
     Returns:
-        True if register is x8-x15 (compressible)
+        imm[8|4:3] in bits [12:10] and imm[7:6|2:1|5] in bits [6:2]
     """
-    return 8 <= reg <= 15
+    return (
+        ((imm9 & 0x100) << 4)  # imm[8] -> bit [12]
+        | ((imm9 & 0x18) << 7)  # imm[4:3] -> bits [11:10]
+        | ((imm9 & 0xC0) >> 1)  # imm[7:6] -> bits [6:5]
+        | ((imm9 & 0x6) << 2)  # imm[2:1] -> bits [4:3]
+        | ((imm9 & 0x20) >> 3)  # imm[5] -> bit [2]
+    )
+
+
+# Both scatters are fixed bit permutations of a small input, so they are
+# evaluated once per possible offset and looked up by the encoders.
+_CJ_IMM_TABLE = tuple(_cj_imm_bits(imm12) for imm12 in range(0x1000))
+_CB_IMM_TABLE = tuple(_cb_imm_bits(imm9) for imm9 in range(0x200))
 
 
 # =============================================================================
@@ -114,20 +126,20 @@ def enc_c_addi4spn(rd_prime: int, nzuimm: int) -> int:
     Returns:
         16-bit encoded instruction
     """
-    assert 8 <= rd_prime <= 15, f"rd' must be x8-x15, got x{rd_prime}"
-    assert nzuimm != 0 and nzuimm % 4 == 0, "nzuimm must be non-zero multiple of 4"
-    assert 4 <= nzuimm <= 1020, f"nzuimm out of range: {nzuimm}"
+    assert not ((rd_prime ^ 8) & ~0x7), f"rd' must be x8-x15, got x{rd_prime}"
+    assert nzuimm != 0 and not (
+        nzuimm & ~0x3FC
+    ), f"nzuimm must be a non-zero multiple of 4 up to 1020, got {nzuimm}"
 
     # Immediate encoding: nzuimm[5:4|9:6|2|3]
     # Bits [12:5] = nzuimm[5:4] | nzuimm[9:6] | nzuimm[2] | nzuimm[3]
-    imm = nzuimm
-    return CompressedEncoder._pack_bits(
-        ((imm >> 4) & 0x3, 11, 0x3),  # nzuimm[5:4] -> bits [12:11]
-        ((imm >> 6) & 0xF, 7, 0xF),  # nzuimm[9:6] -> bits [10:7]
-        ((imm >> 2) & 0x1, 6, 0x1),  # nzuimm[2] -> bit [6]
-        ((imm >> 3) & 0x1, 5, 0x1),  # nzuimm[3] -> bit [5]
-        (compress_reg(rd_prime), 2, 0x7),  # rd' -> bits [4:2]
-        (0b00, 0, 0x3),  # opcode quadrant 0
+    return (
+        0x0000  # opcode quadrant 0
+        | ((nzuimm & 0x30) << 7)  # nzuimm[5:4] -> bits [12:11]
+        | ((nzuimm & 0x3C0) << 1)  # nzuimm[9:6] -> bits [10:7]
+        | ((nzuimm & 0x4) << 4)  # nzuimm[2] -> bit [6]
+        | ((nzuimm & 0x8) << 2)  # nzuimm[3] -> bit [5]
+        | ((rd_prime & 0x7) << 2)  # rd' -> bits [4:2]
     )
 
 
@@ -144,18 +156,17 @@ def enc_c_lw(rd_prime: int, rs1_prime: int, uimm: int) -> int:
     Returns:
         16-bit encoded instruction
     """
-    assert 8 <= rd_prime <= 15 and 8 <= rs1_prime <= 15
-    assert uimm % 4 == 0 and 0 <= uimm <= 124, "uimm must be 0-124, multiple of 4"
+    assert not (((rd_prime ^ 8) | (rs1_prime ^ 8)) & ~0x7)
+    assert not (uimm & ~0x7C), "uimm must be 0-124, multiple of 4"
 
     # uimm[5:3|2|6] encoding
-    return CompressedEncoder._pack_bits(
-        (0b010, 13, 0x7),  # funct3
-        ((uimm >> 6) & 0x1, 5, 0x1),  # uimm[6] -> bit [5]
-        ((uimm >> 3) & 0x7, 10, 0x7),  # uimm[5:3] -> bits [12:10]
-        (compress_reg(rs1_prime), 7, 0x7),  # rs1' -> bits [9:7]
-        ((uimm >> 2) & 0x1, 6, 0x1),  # uimm[2] -> bit [6]
-        (compress_reg(rd_prime), 2, 0x7),  # rd' -> bits [4:2]
-        (0b00, 0, 0x3),  # opcode quadrant 0
+    return (
+        0x4000  # funct3, opcode quadrant 0
+        | ((uimm & 0x40) >> 1)  # uimm[6] -> bit [5]
+        | ((uimm & 0x38) << 7)  # uimm[5:3] -> bits [12:10]
+        | ((rs1_prime & 0x7) << 7)  # rs1' -> bits [9:7]
+        | ((uimm & 0x4) << 4)  # uimm[2] -> bit [6]
+        | ((rd_prime & 0x7) << 2)  # rd' -> bits [4:2]
     )
 
 
@@ -172,18 +183,17 @@ def enc_c_sw(rs1_prime: int, rs2_prime: int, uimm: int) -> int:
     Returns:
         16-bit encoded instruction
     """
-    assert 8 <= rs1_prime <= 15 and 8 <= rs2_prime <= 15
-    assert uimm % 4 == 0 and 0 <= uimm <= 124
+    assert not (((rs1_prime ^ 8) | (rs2_prime ^ 8)) & ~0x7)
+    assert not (uimm & ~0x7C)
 
     # uimm[5:3|2|6] encoding (same as C.LW)
-    return CompressedEncoder._pack_bits(
-        (0b110, 13, 0x7),  # funct3
-        ((uimm >> 6) & 0x1, 5, 0x1),  # uimm[6] -> bit [5]
-        ((uimm >> 3) & 0x7, 10, 0x7),  # uimm[5:3] -> bits [12:10]
-        (compress_reg(rs1_prime), 7, 0x7),  # rs1' -> bits [9:7]
-        ((uimm >> 2) & 0x1, 6, 0x1),  # uimm[2] -> bit [6]
-        (compress_reg(rs2_prime), 2, 0x7),  # rs2' -> bits [4:2]
-        (0b00, 0, 0x3),  # opcode quadrant 0
+    return (
+        0xC000  # funct3, opcode quadrant 0
+        | ((uimm & 0x40) >> 1)  # uimm[6] -> bit [5]
+        | ((uimm & 0x38) << 7)  # uimm[5:3] -> bits [12:10]
+        | ((rs1_prime & 0x7) << 7)  # rs1' -> bits [9:7]
+        | ((uimm & 0x4) << 4)  # uimm[2] -> bit [6]
+        | ((rs2_prime & 0x7) << 2)  # rs2' -> bits [4:2]
     )
 
 
@@ -200,18 +210,17 @@ def enc_c_flw(rd_prime: int, rs1_prime: int, uimm: int) -> int:
     Returns:
         16-bit encoded instruction
     """
-    assert 8 <= rd_prime <= 15 and 8 <= rs1_prime <= 15
-    assert uimm % 4 == 0 and 0 <= uimm <= 124, "uimm must be 0-124, multiple of 4"
+    assert not (((rd_prime ^ 8) | (rs1_prime ^ 8)) & ~0x7)
+    assert not (uimm & ~0x7C), "uimm must be 0-124, multiple of 4"
 
     # uimm[5:3|2|6] encoding (same as C.LW)
-    return CompressedEncoder._pack_bits(
-        (0b011, 13, 0x7),  # funct3 for C.FLW
-        ((uimm >> 6) & 0x1, 5, 0x1),  # uimm[6] -> bit [5]
-        ((uimm >> 3) & 0x7, 10, 0x7),  # uimm[5:3] -> bits [12:10]
-        (compress_reg(rs1_prime), 7, 0x7),  # rs1' -> bits [9:7]
-        ((uimm >> 2) & 0x1, 6, 0x1),  # uimm[2] -> bit [6]
-        (compress_reg(rd_prime), 2, 0x7),  # rd' -> bits [4:2]
-        (0b00, 0, 0x3),  # opcode quadrant 0
+    return (
+        0x6000  # funct3 for C.FLW, opcode quadrant 0
+        | ((uimm & 0x40) >> 1)  # uimm[6] -> bit [5]
+        | ((uimm & 0x38) << 7)  # uimm[5:3] -> bits [12:10]
+        | ((rs1_prime & 0x7) << 7)  # rs1' -> bits [9:7]
+        | ((uimm & 0x4) << 4)  # uimm[2] -> bit [6]
+        | ((rd_prime & 0x7) << 2)  # rd' -> bits [4:2]
     )
 
 
@@ -228,18 +237,17 @@ def enc_c_fsw(rs1_prime: int, rs2_prime: int, uimm: int) -> int:
     Returns:
         16-bit encoded instruction
     """
-    assert 8 <= rs1_prime <= 15 and 8 <= rs2_prime <= 15
-    assert uimm % 4 == 0 and 0 <= uimm <= 124
+    assert not (((rs1_prime ^ 8) | (rs2_prime ^ 8)) & ~0x7)
+    assert not (uimm & ~0x7C)
 
     # uimm[5:3|2|6] encoding (same as C.SW)
-    return CompressedEncoder._pack_bits(
-        (0b111, 13, 0x7),  # funct3 for C.FSW
-        ((uimm >> 6) & 0x1, 5, 0x1),  # uimm[6] -> bit [5]
-        ((uimm >> 3) & 0x7, 10, 0x7),  # uimm[5:3] -> bits [12:10]
-        (compress_reg(rs1_prime), 7, 0x7),  # rs1' -> bits [9:7]
-        ((uimm >> 2) & 0x1, 6, 0x1),  # uimm[2] -> bit [6]
-        (compress_reg(rs2_prime), 2, 0x7),  # rs2' -> bits [4:2]
-        (0b00, 0, 0x3),  # opcode quadrant 0
+    return (
+        0xE000  # funct3 for C.FSW, opcode quadrant 0
+        | ((uimm & 0x40) >> 1)  # uimm[6] -> bit [5]
+        | ((uimm & 0x38) << 7)  # uimm[5:3] -> bits [12:10]
+        | ((rs1_prime & 0x7) << 7)  # rs1' -> bits [9:7]
+        | ((uimm & 0x4) << 4)  # uimm[2] -> bit [6]
+        | ((rs2_prime & 0x7) << 2)  # rs2' -> bits [4:2]
     )
 
 
@@ -270,17 +278,14 @@ def enc_c_addi(rd: int, nzimm: int) -> int:
         16-bit encoded instruction
     """
     assert 0 <= rd <= 31
-    assert -32 <= nzimm <= 31
-
-    # Sign-extend handling: use 6-bit two's complement
-    imm6 = nzimm & 0x3F
-
-    return CompressedEncoder._pack_bits(
-        (0b000, 13, 0x7),  # funct3
-        ((imm6 >> 5) & 0x1, 12, 0x1),  # nzimm[5] -> bit [12]
-        (rd, 7, 0x1F),  # rd -> bits [11:7]
-        (imm6 & 0x1F, 2, 0x1F),  # nzimm[4:0] -> bits [6:2]
-        (0b01, 0, 0x3),  # opcode quadrant 1
+    assert not ((nzimm + 32) & ~0x3F)
+
+    # Per-field masks take the 6-bit two's complement of a negative nzimm
+    return (
+        0x0001  # funct3, opcode quadrant 1
+        | ((nzimm & 0x20) << 7)  # nzimm[5] -> bit [12]
+        | ((rd & 0x1F) << 7)  # rd -> bits [11:7]
+        | ((nzimm & 0x1F) << 2)  # nzimm[4:0] -> bits [6:2]
     )
 
 
@@ -295,24 +300,11 @@ def enc_c_jal(imm: int) -> int:
     Returns:
         16-bit encoded instruction
     """
-    assert imm % 2 == 0, "Jump offset must be even"
-    assert -2048 <= imm <= 2046, f"Jump offset out of range: {imm}"
+    # Biasing by 2048 turns the signed, even range into a plain bitmask test
+    assert not ((imm + 2048) & ~0xFFE), f"Jump offset must be even, in range: {imm}"
 
     # imm[11|4|9:8|10|6|7|3:1|5] encoding
-    imm12 = imm & 0xFFF
-
-    return CompressedEncoder._pack_bits(
-        (0b001, 13, 0x7),  # funct3
-        ((imm12 >> 11) & 0x1, 12, 0x1),  # imm[11] -> bit [12]
-        ((imm12 >> 4) & 0x1, 11, 0x1),  # imm[4] -> bit [11]
-        ((imm12 >> 8) & 0x3, 9, 0x3),  # imm[9:8] -> bits [10:9]
-        ((imm12 >> 10) & 0x1, 8, 0x1),  # imm[10] -> bit [8]
-        ((imm12 >> 6) & 0x1, 7, 0x1),  # imm[6] -> bit [7]
-        ((imm12 >> 7) & 0x1, 6, 0x1),  # imm[7] -> bit [6]
-        ((imm12 >> 1) & 0x7, 3, 0x7),  # imm[3:1] -> bits [5:3]
-        ((imm12 >> 5) & 0x1, 2, 0x1),  # imm[5] -> bit [2]
-        (0b01, 0, 0x3),  # opcode quadrant 1
-    )
+    return 0x2001 | _CJ_IMM_TABLE[imm & 0xFFF]  # funct3, opcode quadrant 1
 
 
 def enc_c_li(rd: int, imm: int) -> int:
@@ -328,16 +320,13 @@ def enc_c_li(rd: int, imm: int) -> int:
         16-bit encoded instruction
     """
     assert 1 <= rd <= 31, "rd must be x1-x31 for C.LI"
-    assert -32 <= imm <= 31
-
-    imm6 = imm & 0x3F
+    assert not ((imm + 32) & ~0x3F)
 
-    return CompressedEncoder._pack_bits(
-        (0b010, 13, 0x7),  # funct3
-        ((imm6 >> 5) & 0x1, 12, 0x1),  # imm[5] -> bit [12]
-        (rd, 7, 0x1F),  # rd -> bits [11:7]
-        (imm6 & 0x1F, 2, 0x1F),  # imm[4:0] -> bits [6:2]
-        (0b01, 0, 0x3),  # opcode quadrant 1
+    return (
+        0x4001  # funct3, opcode quadrant 1
+        | ((imm & 0x20) << 7)  # imm[5] -> bit [12]
+        | ((rd & 0x1F) << 7)  # rd -> bits [11:7]
+        | ((imm & 0x1F) << 2)  # imm[4:0] -> bits [6:2]
     )
 
 
@@ -355,19 +344,17 @@ def enc_c_lui(rd: int, nzimm: int) -> int:
     """
     assert 1 <= rd <= 31 and rd != 2, "rd must be x1-x31 except x2"
     assert nzimm != 0, "nzimm must be non-zero for C.LUI"
-    assert -32 <= nzimm <= 31
+    assert not ((nzimm + 32) & ~0x3F)
 
-    imm6 = nzimm & 0x3F
-
-    return CompressedEncoder._pack_bits(
-        (0b011, 13, 0x7),  # funct3
-        ((imm6 >> 5) & 0x1, 12, 0x1),  # nzimm[5] -> bit [12] (sign bit)
-        (rd, 7, 0x1F),  # rd -> bits [11:7]
-        (imm6 & 0x1F, 2, 0x1F),  # nzimm[4:0] -> bits [6:2]
-        (0b01, 0, 0x3),  # opcode quadrant 1
+    return (
+        0x6001  # funct3, opcode quadrant 1
+        | ((nzimm & 0x20) << 7)  # nzimm[5] -> bit [12]
+        | ((rd & 0x1F) << 7)  # rd -> bits [11:7]
+        | ((nzimm & 0x1F) << 2)  # nzimm[4:0] -> bits [6:2]
     )
 
 
+@cache  # 63 legal frame sizes, and prologues reuse a handful of them
 def enc_c_addi16sp(nzimm: int) -> int:
     """Encode C.ADDI16SP: addi sp, sp, nzimm*16.
 
@@ -379,21 +366,18 @@ def enc_c_addi16sp(nzimm: int) -> int:
     Returns:
         16-bit encoded instruction
     """
-    assert nzimm != 0 and nzimm % 16 == 0, "nzimm must be non-zero multiple of 16"
-    assert -512 <= nzimm <= 496, f"nzimm out of range: {nzimm}"
+    assert nzimm != 0 and not (
+        (nzimm + 512) & ~0x3F0
+    ), f"nzimm must be a non-zero multiple of 16 in [-512, 496], got {nzimm}"
 
     # nzimm[9|4|6|8:7|5] encoding
-    imm = nzimm & 0x3FF
-
-    return CompressedEncoder._pack_bits(
-        (0b011, 13, 0x7),  # funct3
-        ((imm >> 9) & 0x1, 12, 0x1),  # nzimm[9] -> bit [12] (sign)
-        (2, 7, 0x1F),  # rd=x2 (sp) -> bits [11:7]
-        ((imm >> 4) & 0x1, 6, 0x1),  # nzimm[4] -> bit [6]
-        ((imm >> 6) & 0x1, 5, 0x1),  # nzimm[6] -> bit [5]
-        ((imm >> 7) & 0x3, 3, 0x3),  # nzimm[8:7] -> bits [4:3]
-        ((imm >> 5) & 0x1, 2, 0x1),  # nzimm[5] -> bit [2]
-        (0b01, 0, 0x3),  # opcode quadrant 1
+    return (
+        0x6101  # funct3, rd=x2 (sp) -> bits [11:7], opcode quadrant 1
+        | ((nzimm & 0x200) << 3)  # nzimm[9] -> bit [12] (sign)
+        | ((nzimm & 0x10) << 2)  # nzimm[4] -> bit [6]
+        | ((nzimm & 0x40) >> 1)  # nzimm[6] -> bit [5]
+        | ((nzimm & 0x180) >> 4)  # nzimm[8:7] -> bits [4:3]
+        | ((nzimm & 0x20) >> 3)  # nzimm[5] -> bit [2]
     )
 
 
@@ -409,16 +393,13 @@ def enc_c_srli(rd_prime: int, shamt: int) -> int:
     Returns:
         16-bit encoded instruction
     """
-    assert 8 <= rd_prime <= 15
+    assert not ((rd_prime ^ 8) & ~0x7)
     assert 1 <= shamt <= 31, "shamt must be 1-31 for RV32"
 
-    return CompressedEncoder._pack_bits(
-        (0b100, 13, 0x7),  # funct3
-        (0, 12, 0x1),  # shamt[5]=0 for RV32
-        (0b00, 10, 0x3),  # funct2 for SRLI
-        (compress_reg(rd_prime), 7, 0x7),  # rd'/rs1' -> bits [9:7]
-        (shamt & 0x1F, 2, 0x1F),  # shamt[4:0] -> bits [6:2]
-        (0b01, 0, 0x3),  # opcode quadrant 1
+    return (
+        0x8001  # funct3, shamt[5]=0 for RV32, funct2 for SRLI, quadrant 1
+        | ((rd_prime & 0x7) << 7)  # rd'/rs1' -> bits [9:7]
+        | ((shamt & 0x1F) << 2)  # shamt[4:0] -> bits [6:2]
     )
 
 
@@ -434,16 +415,13 @@ def enc_c_srai(rd_prime: int, shamt: int) -> int:
     Returns:
         16-bit encoded instruction
     """
-    assert 8 <= rd_prime <= 15
+    assert not ((rd_prime ^ 8) & ~0x7)
     assert 1 <= shamt <= 31
 
-    return CompressedEncoder._pack_bits(
-        (0b100, 13, 0x7),  # funct3
-        (0, 12, 0x1),  # shamt[5]=0 for RV32
-        (0b01, 10, 0x3),  # funct2 for SRAI
-        (compress_reg(rd_prime), 7, 0x7),  # rd'/rs1' -> bits [9:7]
-        (shamt & 0x1F, 2, 0x1F),  # shamt[4:0] -> bits [6:2]
-        (0b01, 0, 0x3),  # opcode quadrant 1
+    return (
+        0x8401  # funct3, shamt[5]=0 for RV32, funct2 for SRAI, quadrant 1
+        | ((rd_prime & 0x7) << 7)  # rd'/rs1' -> bits [9:7]
+        | ((shamt & 0x1F) << 2)  # shamt[4:0] -> bits [6:2]
     )
 
 
@@ -459,79 +437,61 @@ def enc_c_andi(rd_prime: int, imm: int) -> int:
     Returns:
         16-bit encoded instruction
     """
-    assert 8 <= rd_prime <= 15
-    assert -32 <= imm <= 31
-
-    imm6 = imm & 0x3F
-
-    return CompressedEncoder._pack_bits(
-        (0b100, 13, 0x7),  # funct3
-        ((imm6 >> 5) & 0x1, 12, 0x1),  # imm[5] -> bit [12]
-        (0b10, 10, 0x3),  # funct2 for ANDI
-        (compress_reg(rd_prime), 7, 0x7),  # rd'/rs1' -> bits [9:7]
-        (imm6 & 0x1F, 2, 0x1F),  # imm[4:0] -> bits [6:2]
-        (0b01, 0, 0x3),  # opcode quadrant 1
+    assert not ((rd_prime ^ 8) & ~0x7)
+    assert not ((imm + 32) & ~0x3F)
+
+    return (
+        0x8801  # funct3, funct2 for ANDI, opcode quadrant 1
+        | ((imm & 0x20) << 7)  # imm[5] -> bit [12]
+        | ((rd_prime & 0x7) << 7)  # rd'/rs1' -> bits [9:7]
+        | ((imm & 0x1F) << 2)  # imm[4:0] -> bits [6:2]
     )
 
 
+def _ca_table(base: int) -> tuple[int, ...]:
+    return tuple(
+        base
+        | ((rd_prime & 0x7) << 7)  # rd'/rs1' -> bits [9:7]
+        | ((rs2_prime & 0x7) << 2)  # rs2' -> bits [4:2]
+        for rd_prime in range(16)
+        for rs2_prime in range(16)
+    )
+
+
+# CA-format register ops have only 8 x 8 legal operand pairs, so each one is
+# a precomputed table indexed by (rd' << 4) | rs2'.
+_C_SUB_TABLE = _ca_table(0x8C01)  # funct3, bit [12] = 0, funct2 for SUB, quadrant 1
+_C_XOR_TABLE = _ca_table(0x8C21)  # funct2 for XOR
+_C_OR_TABLE = _ca_table(0x8C41)  # funct2 for OR
+_C_AND_TABLE = _ca_table(0x8C61)  # funct2 for AND
+
+
 def enc_c_sub(rd_prime: int, rs2_prime: int) -> int:
     """Encode C.SUB: sub rd', rd', rs2'."""
-    assert 8 <= rd_prime <= 15 and 8 <= rs2_prime <= 15
-
-    return CompressedEncoder._pack_bits(
-        (0b100, 13, 0x7),  # funct3
-        (0, 12, 0x1),  # bit [12] = 0
-        (0b11, 10, 0x3),  # funct2
-        (compress_reg(rd_prime), 7, 0x7),  # rd'/rs1'
-        (0b00, 5, 0x3),  # funct2 for SUB
-        (compress_reg(rs2_prime), 2, 0x7),  # rs2'
-        (0b01, 0, 0x3),  # opcode quadrant 1
-    )
+    assert not (((rd_prime ^ 8) | (rs2_prime ^ 8)) & ~0x7)
+
+    return _C_SUB_TABLE[(rd_prime << 4) | rs2_prime]
 
 
 def enc_c_xor(rd_prime: int, rs2_prime: int) -> int:
     """Encode C.XOR: xor rd', rd', rs2'."""
-    assert 8 <= rd_prime <= 15 and 8 <= rs2_prime <= 15
-
-    return CompressedEncoder._pack_bits(
-        (0b100, 13, 0x7),
-        (0, 12, 0x1),
-        (0b11, 10, 0x3),
-        (compress_reg(rd_prime), 7, 0x7),
-        (0b01, 5, 0x3),  # funct2 for XOR
-        (compress_reg(rs2_prime), 2, 0x7),
-        (0b01, 0, 0x3),
-    )
+    assert not (((rd_prime ^ 8) | (rs2_prime ^ 8)) & ~0x7)
+
+    return _C_XOR_TABLE[(rd_prime << 4) | rs2_prime]
 
 
 def enc_c_or(rd_prime: int, rs2_prime: int) -> int:
     """Encode C.OR: or rd', rd', rs2'."""
-    assert 8 <= rd_prime <= 15 and 8 <= rs2_prime <= 15
-
-    return CompressedEncoder._pack_bits(
-        (0b100, 13, 0x7),
-        (0, 12, 0x1),
-        (0b11, 10, 0x3),
-        (compress_reg(rd_prime), 7, 0x7),
-        (0b10, 5, 0x3),  # funct2 for OR
-        (compress_reg(rs2_prime), 2, 0x7),
-        (0b01, 0, 0x3),
-    )
+    assert not (((rd_prime ^ 8) | (rs2_prime ^ 8)) & ~0x7)
+
+    return _C_OR_TABLE[(rd_prime << 4) | rs2_prime]
 
 
 def enc_c_and(rd_prime: int, rs2_prime: int) -> int:
     """Encode C.AND: and rd', rd', rs2'."""
-    assert 8 <= rd_prime <= 15 and 8 <= rs2_prime <= 15
-
-    return CompressedEncoder._pack_bits(
-        (0b100, 13, 0x7),
-        (0, 12, 0x1),
-        (0b11, 10, 0x3),
-        (compress_reg(rd_prime), 7, 0x7),
-        (0b11, 5, 0x3),  # funct2 for AND
-        (compress_reg(rs2_prime), 2, 0x7),
-        (0b01, 0, 0x3),
-    )
+    assert not (((rd_prime ^ 8) | (rs2_prime ^ 8)) & ~0x7)
+
+    return _C_AND_TABLE[(rd_prime << 4) | rs2_prime]
 
 
 def enc_c_j(imm: int) -> int:
@@ -545,24 +505,10 @@ def enc_c_j(imm: int) -> int:
     Returns:
         16-bit encoded instruction
     """
-    assert imm % 2 == 0
-    assert -2048 <= imm <= 2046
+    assert not ((imm + 2048) & ~0xFFE)
 
     # Same encoding as C.JAL but with funct3=101
-    imm12 = imm & 0xFFF
-
-    return CompressedEncoder._pack_bits(
-        (0b101, 13, 0x7),  # funct3 for C.J
-        ((imm12 >> 11) & 0x1, 12, 0x1),
-        ((imm12 >> 4) & 0x1, 11, 0x1),
-        ((imm12 >> 8) & 0x3, 9, 0x3),
-        ((imm12 >> 10) & 0x1, 8, 0x1),
-        ((imm12 >> 6) & 0x1, 7, 0x1),
-        ((imm12 >> 7) & 0x1, 6, 0x1),
-        ((imm12 >> 1) & 0x7, 3, 0x7),
-        ((imm12 >> 5) & 0x1, 2, 0x1),
-        (0b01, 0, 0x3),
-    )
+    return 0xA001 | _CJ_IMM_TABLE[imm & 0xFFF]  # funct3 for C.J, opcode quadrant 1
 
 
 def enc_c_beqz(rs1_prime: int, imm: int) -> int:
@@ -577,22 +523,14 @@ def enc_c_beqz(rs1_prime: int, imm: int) -> int:
     Returns:
         16-bit encoded instruction
     """
-    assert 8 <= rs1_prime <= 15
-    assert imm % 2 == 0
-    assert -256 <= imm <= 254
+    assert not ((rs1_prime ^ 8) & ~0x7)
+    assert not ((imm + 256) & ~0x1FE)
 
     # imm[8|4:3|7:6|2:1|5] encoding
-    imm9 = imm & 0x1FF
-
-    return CompressedEncoder._pack_bits(
-        (0b110, 13, 0x7),  # funct3
-        ((imm9 >> 8) & 0x1, 12, 0x1),  # imm[8] -> bit [12]
-        ((imm9 >> 3) & 0x3, 10, 0x3),  # imm[4:3] -> bits [11:10]
-        (compress_reg(rs1_prime), 7, 0x7),  # rs1' -> bits [9:7]
-        ((imm9 >> 6) & 0x3, 5, 0x3),  # imm[7:6] -> bits [6:5]
-        ((imm9 >> 1) & 0x3, 3, 0x3),  # imm[2:1] -> bits [4:3]
-        ((imm9 >> 5) & 0x1, 2, 0x1),  # imm[5] -> bit [2]
-        (0b01, 0, 0x3),
+    return (
+        0xC001  # funct3, opcode quadrant 1
+        | ((rs1_prime & 0x7) << 7)  # rs1' -> bits [9:7]
+        | _CB_IMM_TABLE[imm & 0x1FF]
     )
 
 
@@ -608,21 +546,13 @@ def enc_c_bnez(rs1_prime: int, imm: int) -> int:
     Returns:
         16-bit encoded instruction
     """
-    assert 8 <= rs1_prime <= 15
-    assert imm % 2 == 0
-    assert -256 <= imm <= 254
-
-    imm9 = imm & 0x1FF
-
-    return CompressedEncoder._pack_bits(
-        (0b111, 13, 0x7),  # funct3 for BNEZ
-        ((imm9 >> 8) & 0x1, 12, 0x1),
-        ((imm9 >> 3) & 0x3, 10, 0x3),
-        (compress_reg(rs1_prime), 7, 0x7),
-        ((imm9 >> 6) & 0x3, 5, 0x3),
-        ((imm9 >> 1) & 0x3, 3, 0x3),
-        ((imm9 >> 5) & 0x1, 2, 0x1),
-        (0b01, 0, 0x3),
+    assert not ((rs1_prime ^ 8) & ~0x7)
+    assert not ((imm + 256) & ~0x1FE)
+
+    return (
+        0xE001  # funct3 for BNEZ, opcode quadrant 1
+        | ((rs1_prime & 0x7) << 7)  # rs1' -> bits [9:7]
+        | _CB_IMM_TABLE[imm & 0x1FF]
     )
 
 
@@ -646,15 +576,14 @@ def enc_c_slli(rd: int, shamt: int) -> int:
     assert 1 <= rd <= 31
     assert 1 <= shamt <= 31
 
-    return CompressedEncoder._pack_bits(
-        (0b000, 13, 0x7),  # funct3
-        (0, 12, 0x1),  # shamt[5]=0 for RV32
-        (rd, 7, 0x1F),  # rd -> bits [11:7]
-        (shamt & 0x1F, 2, 0x1F),  # shamt[4:0] -> bits [6:2]
-        (0b10, 0, 0x3),  # opcode quadrant 2
+    return (
+        0x0002  # funct3, shamt[5]=0 for RV32, opcode quadrant 2
+        | ((rd & 0x1F) << 7)  # rd -> bits [11:7]
+        | ((shamt & 0x1F) << 2)  # shamt[4:0] -> bits [6:2]
     )
 
 
+@cache  # epilogue reloads repeat the same (rd, slot) pairs
 def enc_c_lwsp(rd: int, uimm: int) -> int:
     """Encode C.LWSP: lw rd, offset(sp).
 
@@ -668,19 +597,27 @@ def enc_c_lwsp(rd: int, uimm: int) -> int:
         16-bit encoded instruction
     """
     assert 1 <= rd <= 31
-    assert uimm % 4 == 0 and 0 <= uimm <= 252
+    assert not (uimm & ~0xFC)
 
     # uimm[5|4:2|7:6] encoding
-    return CompressedEncoder._pack_bits(
-        (0b010, 13, 0x7),  # funct3
-        ((uimm >> 5) & 0x1, 12, 0x1),  # uimm[5] -> bit [12]
-        (rd, 7, 0x1F),  # rd -> bits [11:7]
-        ((uimm >> 2) & 0x7, 4, 0x7),  # uimm[4:2] -> bits [6:4]
-        ((uimm >> 6) & 0x3, 2, 0x3),  # uimm[7:6] -> bits [3:2]
-        (0b10, 0, 0x3),  # opcode quadrant 2
+    return (
+        0x4002  # funct3, opcode quadrant 2
+        | ((uimm & 0x20) << 7)  # uimm[5] -> bit [12]
+        | ((rd & 0x1F) << 7)  # rd -> bits [11:7]
+        | ((uimm & 0x1C) << 2)  # uimm[4:2] -> bits [6:4]
+        | ((uimm & 0xC0) >> 4)  # uimm[7:6] -> bits [3:2]
     )
 
 
+# Register-only encodings depend on nothing but their 5-bit register fields,
+# so every encoding is precomputed; tables are indexed by rs1 or (rd << 5) | rs2.
+_C_JR_TABLE = tuple(
+    0x8002  # funct3, bit [12] = 0, rs2 = 0 for JR, quadrant 2
+    | (rs1 << 7)  # rs1 -> bits [11:7]
+    for rs1 in range(32)
+)
+
+
 def enc_c_jr(rs1: int) -> int:
     """Encode C.JR: jalr x0, rs1, 0.
 
@@ -694,13 +631,16 @@ def enc_c_jr(rs1: int) -> int:
     """
     assert 1 <= rs1 <= 31
 
-    return CompressedEncoder._pack_bits(
-        (0b100, 13, 0x7),  # funct3
-        (0, 12, 0x1),  # bit [12] = 0 for JR/MV
-        (rs1, 7, 0x1F),  # rs1 -> bits [11:7]
-        (0, 2, 0x1F),  # rs2 = 0 for JR
-        (0b10, 0, 0x3),  # opcode quadrant 2
-    )
+    return _C_JR_TABLE[rs1]
+
+
+_C_MV_TABLE = tuple(
+    0x8002  # funct3, bit [12] = 0 for JR/MV, opcode quadrant 2
+    | (rd << 7)  # rd -> bits [11:7]
+    | (rs2 << 2)  # rs2 -> bits [6:2]
+    for rd in range(32)
+    for rs2 in range(32)
+)
 
 
 def enc_c_mv(rd: int, rs2: int) -> int:
@@ -717,13 +657,7 @@ def enc_c_mv(rd: int, rs2: int) -> int:
     """
     assert 1 <= rd <= 31 and 1 <= rs2 <= 31
 
-    return CompressedEncoder._pack_bits(
-        (0b100, 13, 0x7),  # funct3
-        (0, 12, 0x1),  # bit [12] = 0 for JR/MV
-        (rd, 7, 0x1F),  # rd -> bits [11:7]
-        (rs2, 2, 0x1F),  # rs2 -> bits [6:2]
-        (0b10, 0, 0x3),  # opcode quadrant 2
-    )
+    return _C_MV_TABLE[(rd << 5) | rs2]
 
 
 def enc_c_ebreak() -> int:
@@ -735,6 +669,13 @@ def enc_c_ebreak() -> int:
     return 0x9002
 
 
+_C_JALR_TABLE = tuple(
+    0x9002  # funct3, bit [12] = 1, rs2 = 0 for JALR, quadrant 2
+    | (rs1 << 7)  # rs1 -> bits [11:7]
+    for rs1 in range(32)
+)
+
+
 def enc_c_jalr(rs1: int) -> int:
     """Encode C.JALR: jalr ra, rs1, 0.
 
@@ -748,13 +689,16 @@ def enc_c_jalr(rs1: int) -> int:
     """
     assert 1 <= rs1 <= 31
 
-    return CompressedEncoder._pack_bits(
-        (0b100, 13, 0x7),  # funct3
-        (1, 12, 0x1),  # bit [12] = 1 for JALR/ADD
-        (rs1, 7, 0x1F),  # rs1 -> bits [11:7]
-        (0, 2, 0x1F),  # rs2 = 0 for JALR
-        (0b10, 0, 0x3),  # opcode quadrant 2
-    )
+    return _C_JALR_TABLE[rs1]
+
+
+_C_ADD_TABLE = tuple(
+    0x9002  # funct3, bit [12] = 1 for JALR/ADD, opcode quadrant 2
+    | (rd << 7)  # rd -> bits [11:7]
+    | (rs2 << 2)  # rs2 -> bits [6:2]
+    for rd in range(32)
+    for rs2 in range(32)
+)
 
 
 def enc_c_add(rd: int, rs2: int) -> int:
@@ -771,15 +715,10 @@ def enc_c_add(rd: int, rs2: int) -> int:
     """
     assert 1 <= rd <= 31 and 1 <= rs2 <= 31
 
-    return CompressedEncoder._pack_bits(
-        (0b100, 13, 0x7),  # funct3
-        (1, 12, 0x1),  # bit [12] = 1 for JALR/ADD
-        (rd, 7, 0x1F),  # rd -> bits [11:7]
-        (rs2, 2, 0x1F),  # rs2 -> bits [6:2]
-        (0b10, 0, 0x3),  # opcode quadrant 2
-    )
+    return _C_ADD_TABLE[(rd << 5) | rs2]
 
 
+@cache  # prologue spills repeat the same (rs2, slot) pairs
 def enc_c_swsp(rs2: int, uimm: int) -> int:
     """Encode C.SWSP: sw rs2, offset(sp).
 
@@ -793,15 +732,14 @@ def enc_c_swsp(rs2: int, uimm: int) -> int:
         16-bit encoded instruction
     """
     assert 0 <= rs2 <= 31
-    assert uimm % 4 == 0 and 0 <= uimm <= 252
+    assert not (uimm & ~0xFC)
 
     # uimm[5:2|7:6] encoding
-    return CompressedEncoder._pack_bits(
-        (0b110, 13, 0x7),  # funct3
-        ((uimm >> 2) & 0xF, 9, 0xF),  # uimm[5:2] -> bits [12:9]
-        ((uimm >> 6) & 0x3, 7, 0x3),  # uimm[7:6] -> bits [8:7]
-        (rs2, 2, 0x1F),  # rs2 -> bits [6:2]
-        (0b10, 0, 0x3),  # opcode quadrant 2
+    return (
+        0xC002  # funct3, opcode quadrant 2
+        | ((uimm & 0x3C) << 7)  # uimm[5:2] -> bits [12:9]
+        | ((uimm & 0xC0) << 1)  # uimm[7:6] -> bits [8:7]
+        | ((rs2 & 0x1F) << 2)  # rs2 -> bits [6:2]
     )
 
 
@@ -818,16 +756,15 @@ def enc_c_flwsp(rd: int, uimm: int) -> int:
         16-bit encoded instruction
     """
     assert 0 <= rd <= 31
-    assert uimm % 4 == 0 and 0 <= uimm <= 252
+    assert not (uimm & ~0xFC)
 
     # uimm[5|4:2|7:6] encoding (same as C.LWSP)
-    return CompressedEncoder._pack_bits(
-        (0b011, 13, 0x7),  # funct3 for C.FLWSP
-        ((uimm >> 5) & 0x1, 12, 0x1),  # uimm[5] -> bit [12]
-        (rd, 7, 0x1F),  # rd -> bits [11:7]
-        ((uimm >> 2) & 0x7, 4, 0x7),  # uimm[4:2] -> bits [6:4]
-        ((uimm >> 6) & 0x3, 2, 0x3),  # uimm[7:6] -> bits [3:2]
-        (0b10, 0, 0x3),  # opcode quadrant 2
+    return (
+        0x6002  # funct3 for C.FLWSP, opcode quadrant 2
+        | ((uimm & 0x20) << 7)  # uimm[5] -> bit [12]
+        | ((rd & 0x1F) << 7)  # rd -> bits [11:7]
+        | ((uimm & 0x1C) << 2)  # uimm[4:2] -> bits [6:4]
+        | ((uimm & 0xC0) >> 4)  # uimm[7:6] -> bits [3:2]
     )
 
 
@@ -844,13 +781,12 @@ def enc_c_fswsp(rs2: int, uimm: int) -> int:
         16-bit encoded instruction
     """
     assert 0 <= rs2 <= 31
-    assert uimm % 4 == 0 and 0 <= uimm <= 252
+    assert not (uimm & ~0xFC)
 
     # uimm[5:2|7:6] encoding (same as C.SWSP)
-    return CompressedEncoder._pack_bits(
-        (0b111, 13, 0x7),  # funct3 for C.FSWSP
-        ((uimm >> 2) & 0xF, 9, 0xF),  # uimm[5:2] -> bits [12:9]
-        ((uimm >> 6) & 0x3, 7, 0x3),  # uimm[7:6] -> bits [8:7]
-        (rs2, 2, 0x1F),  # rs2 -> bits [6:2]
-        (0b10, 0, 0x3),  # opcode quadrant 2
+    return (
+        0xE002  # funct3 for C.FSWSP, opcode quadrant 2
+        | ((uimm & 0x3C) << 7)  # uimm[5:2] -> bits [12:9]
+        | ((uimm & 0xC0) << 1)  # uimm[7:6] -> bits [8:7]
+        | ((rs2 & 0x1F) << 2)  # rs2 -> bits [6:2]
     )
@@ -52,13 +52,12 @@ Adding New Instructions:
 """
 
 from collections.abc import Callable
+from functools import partial
+from typing import Final
 
 from encoders.instruction_encode import (
-    enc_r,
-    enc_i,
-    enc_i_load,
+    Opcode,
     enc_i_jalr,
-    enc_s,
     enc_b,
     enc_j,
     enc_fence,
@@ -255,36 +254,67 @@ from models.fp_model import (
 )
 
 
+# Field packers shared by the table encoders. Each takes the instruction's fixed
+# bits (funct7, funct3, opcode and any fixed rs2/shamt field) pre-packed into
+# ``const`` and ORs in only the per-call operands; the make_* factories below
+# fold that constant once per mnemonic and bind it with functools.partial.
+
+
+def _pack_rd_rs1_rs2(const: int, rd: int, rs1: int, rs2: int) -> int:
+    return const | ((rs2 & 0x1F) << 20) | ((rs1 & 0x1F) << 15) | ((rd & 0x1F) << 7)
+
+
+def _pack_rd_rs1_imm(const: int, rd: int, rs1: int, imm: int) -> int:
+    return const | ((imm & 0xFFF) << 20) | ((rs1 & 0x1F) << 15) | ((rd & 0x1F) << 7)
+
+
+def _pack_rd_rs1_shamt(const: int, rd: int, rs1: int, sh: int) -> int:
+    return const | ((sh & 0x1F) << 20) | ((rs1 & 0x1F) << 15) | ((rd & 0x1F) << 7)
+
+
+def _pack_rd_rs1(const: int, rd: int, rs1: int) -> int:
+    return const | ((rs1 & 0x1F) << 15) | ((rd & 0x1F) << 7)
+
+
+def _pack_store(const: int, rs2: int, rs1: int, imm: int) -> int:
+    return (
+        const
+        | ((imm & 0xFE0) << 20)  # imm[11:5] -> bits [31:25]
+        | ((rs2 & 0x1F) << 20)
+        | ((rs1 & 0x1F) << 15)
+        | ((imm & 0x1F) << 7)  # imm[4:0] -> bits [11:7]
+    )
+
+
+def _encode_branch(f3: int, rs2: int, rs1: int, offset: int) -> int:
+    # Branches keep going through enc_b for its offset validation
+    return enc_b(rs2, rs1, f3, offset)
+
+
 def make_r_encoder(f7: int, f3: int) -> Callable:
     """Create R-type instruction encoders."""
-    return lambda rd, rs1, rs2: enc_r(f7, rs2, rs1, f3, rd)
+    return partial(_pack_rd_rs1_rs2, (f7 << 25) | (f3 << 12) | Opcode.ALU_REG)
 
 
 def make_i_encoder(f3: int) -> Callable:
     """Create I-type ALU instruction encoders."""
-    return lambda rd, rs1, imm: enc_i(imm, rs1, f3, rd)
+    return partial(_pack_rd_rs1_imm, (f3 << 12) | Opcode.ALU_IMM)
 
 
 def make_i_shift_encoder(f3: int, f7: int) -> Callable:
     """Create I-type shift instruction encoders."""
-    return lambda rd, rs1, sh: enc_i((sh & 0x1F) | (f7 << 5), rs1, f3, rd)
+    return partial(_pack_rd_rs1_shamt, (f7 << 25) | (f3 << 12) | Opcode.ALU_IMM)
 
 
 def make_i_unary_encoder(f3: int, f7: int, rs2_field: int) -> Callable:
-    """Create I-type unary instruction encoders (Zbb clz, ctz, cpop, sext.b, sext.h).
+    """Create I-type encoders with a fixed rs2 field and one source register.
 
-    These instructions encode the operation type in both funct7 and rs2 field,
-    and only take one source register operand.
+    Covers Zbb clz, ctz, cpop, sext.b, sext.h, orc.b, rev8 and the Zbkb
+    brev8, zip, unzip: the operation is selected by funct7 together with a
+    constant in the rs2 field, and only rs1 is an operand.
     """
-    return lambda rd, rs1: enc_i((rs2_field & 0x1F) | (f7 << 5), rs1, f3, rd)
-
-
-def make_i_fixed_encoder(f3: int, f7: int, rs2_field: int) -> Callable:
-    """Create I-type instruction encoders with fixed rs2 field (Zbb orc.b, rev8).
-
-    These instructions use a fixed value in the rs2 field.
-    """
-    return lambda rd, rs1: enc_i((rs2_field & 0x1F) | (f7 << 5), rs1, f3, rd)
+    const = (f7 << 25) | ((rs2_field & 0x1F) << 20) | (f3 << 12) | Opcode.ALU_IMM
+    return partial(_pack_rd_rs1, const)
 
 
 def make_r_unary_encoder(f7: int, f3: int) -> Callable:
@@ -292,22 +322,22 @@ def make_r_unary_encoder(f7: int, f3: int) -> Callable:
 
     These are R-type instructions that only use rs1 (rs2 is always 0).
     """
-    return lambda rd, rs1: enc_r(f7, 0, rs1, f3, rd)
+    return partial(_pack_rd_rs1, (f7 << 25) | (f3 << 12) | Opcode.ALU_REG)
 
 
 def make_load_encoder(f3: int) -> Callable:
     """Create load instruction encoders."""
-    return lambda rd, rs1, imm: enc_i_load(imm, rs1, f3, rd)
+    return partial(_pack_rd_rs1_imm, (f3 << 12) | Opcode.LOAD)
 
 
 def make_store_encoder(f3: int) -> Callable:
     """Create store instruction encoders."""
-    return lambda rs2, rs1, imm: enc_s(rs2, rs1, f3, imm)
+    return partial(_pack_store, (f3 << 12) | Opcode.STORE)
 
 
 def make_branch_encoder(f3: int) -> Callable:
     """Create branch instruction encoders."""
-    return lambda rs2, rs1, offset: enc_b(rs2, rs1, f3, offset)
+    return partial(_encode_branch, f3)
 
 
 # operation tables (opcode name → (encoder, evaluator))
@@ -406,7 +436,7 @@ BRANCHES: dict[str, Callable] = {
 }
 
 JUMPS: dict[str, Callable] = {
-    "jal": lambda rd, offset: enc_j(rd, offset),
+    "jal": enc_j,
     "jalr": lambda rd, rs1, imm: enc_i_jalr(imm, rs1, rd),
 }
 
@@ -459,12 +489,12 @@ I_UNARY: dict[str, tuple[Callable, Callable]] = {
     # zext.h is R-type (opcode 0x33) with funct7=0x04, funct3=4, rs2=0
     "zext.h": (make_r_unary_encoder(0x04, 0x4), zext_h),
     # funct3=5, fixed rs2 value
-    "orc.b": (make_i_fixed_encoder(0x5, 0x14, 7), orc_b),
-    "rev8": (make_i_fixed_encoder(0x5, 0x34, 0x18), rev8),
+    "orc.b": (make_i_unary_encoder(0x5, 0x14, 7), orc_b),
+    "rev8": (make_i_unary_encoder(0x5, 0x34, 0x18), rev8),
     # Zbkb extension - bit manipulation for crypto
-    "brev8": (make_i_fixed_encoder(0x5, 0x34, 7), brev8),
-    "zip": (make_i_fixed_encoder(0x1, 0x04, 15), zip_rv),
-    "unzip": (make_i_fixed_encoder(0x5, 0x04, 15), unzip),
+    "brev8": (make_i_unary_encoder(0x5, 0x34, 7), brev8),
+    "zip": (make_i_unary_encoder(0x1, 0x04, 15), zip_rv),
+    "unzip": (make_i_unary_encoder(0x5, 0x04, 15), unzip),
 }
 
 # A extension (atomics) - Atomic Memory Operations
@@ -529,75 +559,88 @@ TRAP_INSTRS: dict[str, Callable] = {
 # Format: (encoder, evaluator)
 # encoder: lambda rd', rs2' -> 16-bit instruction (rd' and rs2' must be 8-15)
 C_ALU_REG: dict[str, tuple[Callable, Callable]] = {
-    "c.sub": (lambda rd, rs2: enc_c_sub(rd, rs2), sub),
-    "c.xor": (lambda rd, rs2: enc_c_xor(rd, rs2), xor),
-    "c.or": (lambda rd, rs2: enc_c_or(rd, rs2), or_rv),
-    "c.and": (lambda rd, rs2: enc_c_and(rd, rs2), and_rv),
+    "c.sub": (enc_c_sub, sub),
+    "c.xor": (enc_c_xor, xor),
+    "c.or": (enc_c_or, or_rv),
+    "c.and": (enc_c_and, and_rv),
 }
 
 # C extension ALU operations (full register set)
 # Format: (encoder, evaluator)
 C_ALU_FULL: dict[str, tuple[Callable, Callable]] = {
-    "c.mv": (lambda rd, rs2: enc_c_mv(rd, rs2), add),  # add rd, x0, rs2
-    "c.add": (lambda rd, rs2: enc_c_add(rd, rs2), add),  # add rd, rd, rs2
+    "c.mv": (enc_c_mv, add),  # add rd, x0, rs2
+    "c.add": (enc_c_add, add),  # add rd, rd, rs2
 }
 
 # C extension immediate ALU operations (limited register set x8-x15)
 # Format: (encoder, evaluator)
 C_ALU_IMM_LIMITED: dict[str, tuple[Callable, Callable]] = {
-    "c.srli": (lambda rd, shamt: enc_c_srli(rd, shamt), srl),
-    "c.srai": (lambda rd, shamt: enc_c_srai(rd, shamt), sra),
-    "c.andi": (lambda rd, imm: enc_c_andi(rd, imm), and_rv),
+    "c.srli": (enc_c_srli, srl),
+    "c.srai": (enc_c_srai, sra),
+    "c.andi": (enc_c_andi, and_rv),
 }
 
 # C extension immediate ALU operations (full register set)
 # Format: (encoder, evaluator)
 C_ALU_IMM_FULL: dict[str, tuple[Callable, Callable]] = {
-    "c.addi": (lambda rd, imm: enc_c_addi(rd, imm), add),
-    "c.li": (lambda rd, imm: enc_c_li(rd, imm), add),  # addi rd, x0, imm
-    "c.slli": (lambda rd, shamt: enc_c_slli(rd, shamt), sll),
+    "c.addi": (enc_c_addi, add),
+    "c.li": (enc_c_li, add),  # addi rd, x0, imm
+    "c.slli": (enc_c_slli, sll),
 }
 
 # C extension load/store operations (limited register set x8-x15)
 # Format: (encoder, evaluator)
 C_LOADS_LIMITED: dict[str, tuple[Callable, Callable]] = {
-    "c.lw": (lambda rd, rs1, uimm: enc_c_lw(rd, rs1, uimm), lw),
+    "c.lw": (enc_c_lw, lw),
 }
 
 C_STORES_LIMITED: dict[str, Callable] = {
-    "c.sw": lambda rs1, rs2, uimm: enc_c_sw(rs1, rs2, uimm),
+    "c.sw": enc_c_sw,
 }
 
 # C extension stack-relative load/store operations (full register set)
 C_LOADS_STACK: dict[str, tuple[Callable, Callable]] = {
-    "c.lwsp": (lambda rd, uimm: enc_c_lwsp(rd, uimm), lw),
+    "c.lwsp": (enc_c_lwsp, lw),
 }
 
 C_STORES_STACK: dict[str, Callable] = {
-    "c.swsp": lambda rs2, uimm: enc_c_swsp(rs2, uimm),
+    "c.swsp": enc_c_swsp,
 }
 
 # C extension branch operations (limited register set x8-x15)
 # Format: encoder (evaluator not needed - branch taken/not taken is checked separately)
 C_BRANCHES: dict[str, Callable] = {
-    "c.beqz": lambda rs1, offset: enc_c_beqz(rs1, offset),
-    "c.bnez": lambda rs1, offset: enc_c_bnez(rs1, offset),
+    "c.beqz": enc_c_beqz,
+    "c.bnez": enc_c_bnez,
 }
 
 # C extension jump operations
 C_JUMPS: dict[str, Callable] = {
-    "c.j": lambda offset: enc_c_j(offset),
-    "c.jal": lambda offset: enc_c_jal(offset),
-    "c.jr": lambda rs1: enc_c_jr(rs1),
-    "c.jalr": lambda rs1: enc_c_jalr(rs1),
+    "c.j": enc_c_j,
+    "c.jal": enc_c_jal,
+    "c.jr": enc_c_jr,
+    "c.jalr": enc_c_jalr,
 }
 
 # C extension special operations
 C_SPECIAL: dict[str, tuple[Callable, Callable]] = {
-    "c.lui": (lambda rd, imm: enc_c_lui(rd, imm), lambda x, y: (y << 12) & 0xFFFFFFFF),
-    "c.addi16sp": (lambda imm: enc_c_addi16sp(imm), add),
+    "c.lui": (enc_c_lui, lambda x, y: (y << 12) & 0xFFFFFFFF),
+    "c.addi16sp": (enc_c_addi16sp, add),
 }
 
+# All compressed integer operations with an evaluator, merged once at import.
+# Store, branch and jump tables are encoder-only and stay separate.
+# Format: (encoder, evaluator)
+C_ALL: dict[str, tuple[Callable, Callable]] = (
+    C_ALU_REG
+    | C_ALU_FULL
+    | C_ALU_IMM_LIMITED
+    | C_ALU_IMM_FULL
+    | C_LOADS_LIMITED
+    | C_LOADS_STACK
+    | C_SPECIAL
+)
+
 # Helper to check if a register can be used in compressed instructions
 is_compressed_reg = is_compressible_reg
 
@@ -616,25 +659,25 @@ is_compressed_reg = is_compressible_reg
 # Compressed FP load (limited register set: f8-f15 for rd', x8-x15 for rs1')
 # Format: (encoder, evaluator)
 C_FP_LOADS_LIMITED: dict[str, tuple[Callable, Callable]] = {
-    "c.flw": (lambda rd, rs1, uimm: enc_c_flw(rd, rs1, uimm), lw),
+    "c.flw": (enc_c_flw, lw),
 }
 
 # Compressed FP store (limited register set: x8-x15 for rs1', f8-f15 for rs2')
 # Format: encoder only (store has no return value)
 C_FP_STORES_LIMITED: dict[str, Callable] = {
-    "c.fsw": lambda rs1, rs2, uimm: enc_c_fsw(rs1, rs2, uimm),
+    "c.fsw": enc_c_fsw,
 }
 
 # Compressed FP load from stack (full FP register set: f0-f31)
 # Format: (encoder, evaluator)
 C_FP_LOADS_STACK: dict[str, tuple[Callable, Callable]] = {
-    "c.flwsp": (lambda rd, uimm: enc_c_flwsp(rd, uimm), lw),
+    "c.flwsp": (enc_c_flwsp, lw),
 }
 
 # Compressed FP store to stack (full FP register set: f0-f31)
 # Format: encoder only (store has no return value)
 C_FP_STORES_STACK: dict[str, Callable] = {
-    "c.fswsp": lambda rs2, uimm: enc_c_fswsp(rs2, uimm),
+    "c.fswsp": enc_c_fswsp,
 }
 
 # =============================================================================
@@ -665,15 +708,15 @@ C_FP_STORES_STACK: dict[str, Callable] = {
 
 # FP arithmetic operations (two FP operands -> FP result)
 FP_ARITH_2OP: dict[str, tuple[Callable, Callable]] = {
-    "fadd.s": (lambda rd, rs1, rs2: enc_fadd_s(rd, rs1, rs2), fadd_s),
-    "fsub.s": (lambda rd, rs1, rs2: enc_fsub_s(rd, rs1, rs2), fsub_s),
-    "fmul.s": (lambda rd, rs1, rs2: enc_fmul_s(rd, rs1, rs2), fmul_s),
-    "fdiv.s": (lambda rd, rs1, rs2: enc_fdiv_s(rd, rs1, rs2), fdiv_s),
+    "fadd.s": (enc_fadd_s, fadd_s),
+    "fsub.s": (enc_fsub_s, fsub_s),
+    "fmul.s": (enc_fmul_s, fmul_s),
+    "fdiv.s": (enc_fdiv_s, fdiv_s),
 }
 
 # FP single-operand arithmetic (one FP operand -> FP result)
 FP_ARITH_1OP: dict[str, tuple[Callable, Callable]] = {
-    "fsqrt.s": (lambda rd, rs1: enc_fsqrt_s(rd, rs1), fsqrt_s),
+    "fsqrt.s": (enc_fsqrt_s, fsqrt_s),
 }
 
 # FP fused multiply-add (three FP operands -> FP result)
@@ -681,63 +724,63 @@ FP_ARITH_1OP: dict[str, tuple[Callable, Callable]] = {
 #   encoder: lambda rd, rs1, rs2, rs3 -> 32-bit instruction
 #   evaluator: lambda rs1_bits, rs2_bits, rs3_bits -> result_bits
 FP_FMA: dict[str, tuple[Callable, Callable]] = {
-    "fmadd.s": (lambda rd, rs1, rs2, rs3: enc_fmadd_s(rd, rs1, rs2, rs3), fmadd_s),
-    "fmsub.s": (lambda rd, rs1, rs2, rs3: enc_fmsub_s(rd, rs1, rs2, rs3), fmsub_s),
-    "fnmadd.s": (lambda rd, rs1, rs2, rs3: enc_fnmadd_s(rd, rs1, rs2, rs3), fnmadd_s),
-    "fnmsub.s": (lambda rd, rs1, rs2, rs3: enc_fnmsub_s(rd, rs1, rs2, rs3), fnmsub_s),
+    "fmadd.s": (enc_fmadd_s, fmadd_s),
+    "fmsub.s": (enc_fmsub_s, fmsub_s),
+    "fnmadd.s": (enc_fnmadd_s, fnmadd_s),
+    "fnmsub.s": (enc_fnmsub_s, fnmsub_s),
 }
 
 # FP sign injection (two FP operands -> FP result)
 FP_SGNJ: dict[str, tuple[Callable, Callable]] = {
-    "fsgnj.s": (lambda rd, rs1, rs2: enc_fsgnj_s(rd, rs1, rs2), fsgnj_s),
-    "fsgnjn.s": (lambda rd, rs1, rs2: enc_fsgnjn_s(rd, rs1, rs2), fsgnjn_s),
-    "fsgnjx.s": (lambda rd, rs1, rs2: enc_fsgnjx_s(rd, rs1, rs2), fsgnjx_s),
+    "fsgnj.s": (enc_fsgnj_s, fsgnj_s),
+    "fsgnjn.s": (enc_fsgnjn_s, fsgnjn_s),
+    "fsgnjx.s": (enc_fsgnjx_s, fsgnjx_s),
 }
 
 # FP min/max (two FP operands -> FP result)
 FP_MINMAX: dict[str, tuple[Callable, Callable]] = {
-    "fmin.s": (lambda rd, rs1, rs2: enc_fmin_s(rd, rs1, rs2), fmin_s),
-    "fmax.s": (lambda rd, rs1, rs2: enc_fmax_s(rd, rs1, rs2), fmax_s),
+    "fmin.s": (enc_fmin_s, fmin_s),
+    "fmax.s": (enc_fmax_s, fmax_s),
 }
 
 # FP comparison (two FP operands -> integer result: 0 or 1)
 # Note: Result goes to INTEGER register, not FP register
 FP_CMP: dict[str, tuple[Callable, Callable]] = {
-    "feq.s": (lambda rd, rs1, rs2: enc_feq_s(rd, rs1, rs2), feq_s),
-    "flt.s": (lambda rd, rs1, rs2: enc_flt_s(rd, rs1, rs2), flt_s),
-    "fle.s": (lambda rd, rs1, rs2: enc_fle_s(rd, rs1, rs2), fle_s),
+    "feq.s": (enc_feq_s, feq_s),
+    "flt.s": (enc_flt_s, flt_s),
+    "fle.s": (enc_fle_s, fle_s),
 }
 
 # FP to integer conversion (FP operand -> integer result)
 # Note: Result goes to INTEGER register
 FP_CVT_F2I: dict[str, tuple[Callable, Callable]] = {
-    "fcvt.w.s": (lambda rd, rs1: enc_fcvt_w_s(rd, rs1), fcvt_w_s),
-    "fcvt.wu.s": (lambda rd, rs1: enc_fcvt_wu_s(rd, rs1), fcvt_wu_s),
+    "fcvt.w.s": (enc_fcvt_w_s, fcvt_w_s),
+    "fcvt.wu.s": (enc_fcvt_wu_s, fcvt_wu_s),
 }
 
 # Integer to FP conversion (integer operand -> FP result)
 # Note: Source is INTEGER register, result goes to FP register
 FP_CVT_I2F: dict[str, tuple[Callable, Callable]] = {
-    "fcvt.s.w": (lambda rd, rs1: enc_fcvt_s_w(rd, rs1), fcvt_s_w),
-    "fcvt.s.wu": (lambda rd, rs1: enc_fcvt_s_wu(rd, rs1), fcvt_s_wu),
+    "fcvt.s.w": (enc_fcvt_s_w, fcvt_s_w),
+    "fcvt.s.wu": (enc_fcvt_s_wu, fcvt_s_wu),
 }
 
 # FP to integer move (copy bits without conversion)
 # Note: Result goes to INTEGER register
 FP_MV_F2I: dict[str, tuple[Callable, Callable]] = {
-    "fmv.x.w": (lambda rd, rs1: enc_fmv_x_w(rd, rs1), fmv_x_w),
+    "fmv.x.w": (enc_fmv_x_w, fmv_x_w),
 }
 
 # Integer to FP move (copy bits without conversion)
 # Note: Source is INTEGER register, result goes to FP register
 FP_MV_I2F: dict[str, tuple[Callable, Callable]] = {
-    "fmv.w.x": (lambda rd, rs1: enc_fmv_w_x(rd, rs1), fmv_w_x),
+    "fmv.w.x": (enc_fmv_w_x, fmv_w_x),
 }
 
 # FP classify (FP operand -> integer bitmask result)
 # Note: Result goes to INTEGER register
 FP_CLASS: dict[str, tuple[Callable, Callable]] = {
-    "fclass.s": (lambda rd, rs1: enc_fclass_s(rd, rs1), fclass_s),
+    "fclass.s": (enc_fclass_s, fclass_s),
 }
 
 # FP load (memory -> FP register)
@@ -745,12 +788,89 @@ FP_CLASS: dict[str, tuple[Callable, Callable]] = {
 #   encoder: lambda rd, rs1, imm -> 32-bit instruction
 #   evaluator: same as lw (loads 32 bits)
 FP_LOADS: dict[str, tuple[Callable, Callable]] = {
-    "flw": (lambda rd, rs1, imm: enc_flw(rd, rs1, imm), lw),
+    "flw": (enc_flw, lw),
 }
 
 # FP store (FP register -> memory)
 # Format: encoder only (store has no return value)
 #   encoder: lambda rs2, rs1, imm -> 32-bit instruction
 FP_STORES: dict[str, Callable] = {
-    "fsw": lambda rs2, rs1, imm: enc_fsw(rs2, rs1, imm),
+    "fsw": enc_fsw,
+}
+
+# =============================================================================
+# Flat dispatch table (32-bit instructions)
+# =============================================================================
+#
+# ALL_OPS maps every 32-bit mnemonic to (operand_layout, encoder, evaluator) so a
+# caller can resolve an operation with one lookup instead of probing each
+# category table in turn. The layout tag says which operands the encoder takes,
+# in order; evaluator is None for tables that are encoder-only. The category
+# tables above stay the source of truth.
+
+OPERANDS_RD_RS1_RS2: Final[int] = 0
+"""Encoder takes (rd, rs1, rs2)."""
+OPERANDS_RD_RS1_IMM: Final[int] = 1
+"""Encoder takes (rd, rs1, imm)."""
+OPERANDS_RD_RS1: Final[int] = 2
+"""Encoder takes (rd, rs1)."""
+OPERANDS_RS2_RS1_IMM: Final[int] = 3
+"""Encoder takes (rs2, rs1, imm) - stores."""
+OPERANDS_RS2_RS1_OFFSET: Final[int] = 4
+"""Encoder takes (rs2, rs1, branch_offset) - conditional branches."""
+OPERANDS_RD_OFFSET: Final[int] = 5
+"""Encoder takes (rd, jump_offset) - jal."""
+OPERANDS_NONE: Final[int] = 6
+"""Encoder takes no operands (fences, trap instructions)."""
+OPERANDS_RD_CSR_RS1: Final[int] = 7
+"""Encoder takes (rd, csr, rs1) - register CSR instructions."""
+OPERANDS_RD_CSR_IMM: Final[int] = 8
+"""Encoder takes (rd, csr, zimm) - immediate CSR instructions."""
+OPERANDS_RD_RS2_RS1: Final[int] = 9
+"""Encoder takes (rd, rs2, rs1) - AMOs and sc.w."""
+OPERANDS_RD_RS1_RS2_RS3: Final[int] = 10
+"""Encoder takes (rd, rs1, rs2, rs3) - fused multiply-add."""
+
+
+def _flatten(
+    layout: int, table: dict[str, tuple[Callable, Callable]] | dict[str, Callable]
+) -> dict[str, tuple[int, Callable, Callable | None]]:
+    """Tag every entry of a category table with its operand layout."""
+    return {
+        name: (layout, *entry) if isinstance(entry, tuple) else (layout, entry, None)
+        for name, entry in table.items()
+    }
+
+
+ALL_OPS: dict[str, tuple[int, Callable, Callable | None]] = {
+    **_flatten(OPERANDS_RD_RS1_RS2, R_ALU),
+    **_flatten(OPERANDS_RD_RS1_IMM, I_ALU),
+    **_flatten(OPERANDS_RD_RS1, I_UNARY),
+    **_flatten(OPERANDS_RD_RS1_IMM, LOADS),
+    **_flatten(OPERANDS_RS2_RS1_IMM, STORES),
+    **_flatten(OPERANDS_RS2_RS1_OFFSET, BRANCHES),
+    "jal": (OPERANDS_RD_OFFSET, JUMPS["jal"], None),
+    "jalr": (OPERANDS_RD_RS1_IMM, JUMPS["jalr"], None),
+    **_flatten(OPERANDS_NONE, FENCES),
+    **_flatten(OPERANDS_RD_CSR_RS1, {k: CSRS[k] for k in ("csrrw", "csrrs", "csrrc")}),
+    **_flatten(
+        OPERANDS_RD_CSR_IMM, {k: CSRS[k] for k in ("csrrwi", "csrrsi", "csrrci")}
+    ),
+    **_flatten(OPERANDS_RD_RS2_RS1, AMO),
+    "lr.w": (OPERANDS_RD_RS1, AMO_LR_SC["lr.w"], None),
+    "sc.w": (OPERANDS_RD_RS2_RS1, AMO_LR_SC["sc.w"], None),
+    **_flatten(OPERANDS_NONE, TRAP_INSTRS),
+    **_flatten(OPERANDS_RD_RS1_RS2, FP_ARITH_2OP),
+    **_flatten(OPERANDS_RD_RS1, FP_ARITH_1OP),
+    **_flatten(OPERANDS_RD_RS1_RS2_RS3, FP_FMA),
+    **_flatten(OPERANDS_RD_RS1_RS2, FP_SGNJ),
+    **_flatten(OPERANDS_RD_RS1_RS2, FP_MINMAX),
+    **_flatten(OPERANDS_RD_RS1_RS2, FP_CMP),
+    **_flatten(OPERANDS_RD_RS1, FP_CVT_F2I),
+    **_flatten(OPERANDS_RD_RS1, FP_CVT_I2F),
+    **_flatten(OPERANDS_RD_RS1, FP_MV_F2I),
+    **_flatten(OPERANDS_RD_RS1, FP_MV_I2F),
+    **_flatten(OPERANDS_RD_RS1, FP_CLASS),
+    **_flatten(OPERANDS_RD_RS1_IMM, FP_LOADS),
+    **_flatten(OPERANDS_RS2_RS1_IMM, FP_STORES),
 }
@@ -21,10 +21,26 @@ Branch Model
 ============
 """
 
+import operator
+from collections.abc import Callable
+
 from config import MASK32
-from utils.riscv_utils import to_signed32
 from utils.validation import ValidationError
 
+# Flipping bit 31 maps two's complement order onto unsigned order, so the
+# signed compares need only a mask and XOR instead of sign extension.
+_SIGN_BIT = 0x80000000
+
+# Mnemonic -> comparison, looked up with a single dict probe per branch.
+_BRANCH_TABLE: dict[str, Callable[[int, int], bool]] = {
+    "beq": operator.eq,  # Branch if equal
+    "bne": operator.ne,  # Branch if not equal
+    "blt": lambda a, b: ((a & MASK32) ^ _SIGN_BIT) < ((b & MASK32) ^ _SIGN_BIT),
+    "bge": lambda a, b: ((a & MASK32) ^ _SIGN_BIT) >= ((b & MASK32) ^ _SIGN_BIT),
+    "bltu": lambda a, b: (a & MASK32) < (b & MASK32),  # Unsigned less than
+    "bgeu": lambda a, b: (a & MASK32) >= (b & MASK32),  # Unsigned greater or equal
+}
+
 
 def branch_taken_decision(operation: str, operand_a: int, operand_b: int) -> bool:
     """Determine if a branch should be taken based on the branch type and operand values.
@@ -37,21 +53,11 @@ def branch_taken_decision(operation: str, operand_a: int, operand_b: int) -> boo
     Returns:
         True if branch condition is satisfied, False otherwise
     """
-    if operation == "beq":  # Branch if equal
-        return operand_a == operand_b
-    if operation == "bne":  # Branch if not equal
-        return operand_a != operand_b
-    if operation == "blt":  # Branch if less than (signed comparison)
-        return to_signed32(operand_a) < to_signed32(operand_b)
-    if operation == "bge":  # Branch if greater or equal (signed comparison)
-        return to_signed32(operand_a) >= to_signed32(operand_b)
-    if operation == "bltu":  # Branch if less than (unsigned comparison)
-        return (operand_a & MASK32) < (operand_b & MASK32)
-    if operation == "bgeu":  # Branch if greater or equal (unsigned comparison)
-        return (operand_a & MASK32) >= (operand_b & MASK32)
-
-    raise ValidationError(
-        "Invalid branch operation",
-        op=operation,
-        valid_ops=["beq", "bne", "blt", "bge", "bltu", "bgeu"],
-    )
+    try:
+        return _BRANCH_TABLE[operation](operand_a, operand_b)
+    except KeyError:
+        raise ValidationError(
+            "Invalid branch operation",
+            op=operation,
+            valid_ops=list(_BRANCH_TABLE),
+        ) from None
@@ -43,12 +43,25 @@ from __future__ import annotations
 
 import math
 import struct
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 if TYPE_CHECKING:
     from models.memory_model import MemoryModel
 
 
+def _unpack_float32(bits: int) -> tuple[int, int, int]:
+    """Split float32 bits into (sign, significand, exponent).
+
+    The value is ``(-1)**sign * significand * 2**exponent`` exactly, with the
+    implicit leading 1 folded into the significand for normal numbers.
+    """
+    exp = (bits >> 23) & 0xFF
+    mant = bits & 0x7FFFFF
+    if exp == 0:
+        return (bits >> 31) & 1, mant, -149  # Subnormal or zero: 0.mant * 2^-126
+    return (bits >> 31) & 1, 0x800000 | mant, exp - 150  # Normal: 1.mant * 2^(exp-127)
+
+
 def _fma_float32(a_bits: int, b_bits: int, c_bits: int) -> int:
     """Compute single-precision fused multiply-add: (a * b) + c with single rounding.
 
@@ -57,266 +70,128 @@ def _fma_float32(a_bits: int, b_bits: int, c_bits: int) -> int:
 
     The algorithm:
     1. Handle special cases (inf, zero) first
-    2. Unpack float32 operands to sign, exponent, mantissa
-    3. Compute product mantissa exactly (48 bits from 24x24)
-    4. Align addend to product's exponent
+    2. Unpack float32 operands to sign, exponent, significand
+    3. Compute product significand exactly (48 bits from 24x24)
+    4. Align product and addend to the smaller exponent
     5. Add/subtract with full precision
-    6. Normalize and round once to float32
+    6. Round once to float32 using round/sticky bits
 
     Returns:
-        32-bit IEEE 754 single-precision result
+        32-bit IEEE 754 single-precision result. Any NaN result is already
+        the canonical NaN, so callers return it without canonicalizing.
     """
-    from decimal import Decimal, localcontext, ROUND_HALF_EVEN
-
-    # Helper functions for special value detection
-    def _is_inf(bits: int) -> bool:
-        return ((bits >> 23) & 0xFF) == 0xFF and (bits & 0x7FFFFF) == 0
-
-    def _is_zero(bits: int) -> bool:
-        return (bits & 0x7FFFFFFF) == 0
-
-    def _get_sign(bits: int) -> int:
-        return (bits >> 31) & 1
-
-    # Handle infinity cases that weren't caught by caller
-    a_inf = _is_inf(a_bits)
-    b_inf = _is_inf(b_bits)
-    c_inf = _is_inf(c_bits)
-    a_zero = _is_zero(a_bits)
-    b_zero = _is_zero(b_bits)
+    # Only an all-ones exponent (infinity; NaNs are filtered by the callers)
+    # needs special handling, so finite operands skip straight to the
+    # integer path
+    if (
+        (a_bits & FP_EXP_MASK) == FP_EXP_MASK
+        or (b_bits & FP_EXP_MASK) == FP_EXP_MASK
+        or (c_bits & FP_EXP_MASK) == FP_EXP_MASK
+    ):
+        a_inf = is_inf(a_bits)
+        b_inf = is_inf(b_bits)
+        c_inf = is_inf(c_bits)
 
-    # inf * 0 = NaN (should be caught by caller, but just in case)
-    if (a_inf and b_zero) or (a_zero and b_inf):
-        return FP_CANONICAL_NAN
+        # inf * 0 = NaN (should be caught by caller, but just in case)
+        if (a_inf and is_zero(b_bits)) or (is_zero(a_bits) and b_inf):
+            return FP_CANONICAL_NAN
 
-    # Product is infinity
-    if a_inf or b_inf:
-        prod_sign = _get_sign(a_bits) ^ _get_sign(b_bits)
-        if c_inf:
-            c_sign = _get_sign(c_bits)
-            if prod_sign != c_sign:
+        # Product is infinity
+        if a_inf or b_inf:
+            prod_sign = ((a_bits ^ b_bits) >> 31) & 1
+            if c_inf and prod_sign != (c_bits >> 31) & 1:
                 # inf + (-inf) = NaN
                 return FP_CANONICAL_NAN
-            else:
-                # inf + inf = inf (same sign)
-                return FP_NEG_INF if prod_sign else FP_POS_INF
-        else:
-            # inf + finite = inf
+            # inf + inf (same sign) or inf + finite = inf
             return FP_NEG_INF if prod_sign else FP_POS_INF
 
-    # Product is finite but c is infinity
-    if c_inf:
-        c_sign = _get_sign(c_bits)
-        return FP_NEG_INF if c_sign else FP_POS_INF
-
-    # All operands are finite - use Decimal with local context for determinism
-    # Using localcontext() instead of getcontext() to avoid global state mutation
-    # Need high precision to handle 48-bit product + alignment shifts without loss
-    with localcontext() as ctx:
-        ctx.prec = 150
-        ctx.rounding = ROUND_HALF_EVEN
-
-        def unpack_float32(bits: int) -> tuple[int, int, int]:
-            """Unpack float32 to (sign, exponent, mantissa)."""
-            sign = (bits >> 31) & 1
-            exp = (bits >> 23) & 0xFF
-            mant = bits & 0x7FFFFF
-            return sign, exp, mant
-
-        def float32_to_decimal(bits: int) -> Decimal:
-            """Convert float32 bits to exact Decimal representation."""
-            sign, exp, mant = unpack_float32(bits)
-
-            if exp == 0:
-                if mant == 0:
-                    return Decimal("0") if sign == 0 else Decimal("-0")  # ±0
-                # Subnormal: (-1)^sign * 2^(-126) * (0.mant)
-                value = Decimal(mant) * Decimal(2) ** Decimal(-149)
-            else:
-                # Normal: (-1)^sign * 2^(exp-127) * (1.mant)
-                value = (Decimal(0x800000 | mant)) * Decimal(2) ** Decimal(exp - 150)
-
-            return -value if sign else value
-
-        def decimal_to_float32(d: Decimal) -> int:
-            """Convert Decimal to float32 bits with proper rounding.
-
-            This implements direct single-precision rounding from Decimal to avoid
-            double-rounding issues that occur when going Decimal -> float64 -> float32.
-
-            Uses integer arithmetic where possible for exact bit extraction.
-            """
-            if d.is_nan():
-                return FP_CANONICAL_NAN
-            if d.is_infinite():
-                return FP_NEG_INF if d < 0 else FP_POS_INF
-            if d == 0:
-                # Preserve sign of zero
-                return FP_NEG_ZERO if d.is_signed() else FP_POS_ZERO
-
-            # Extract sign and work with absolute value
-            sign = 1 if d < 0 else 0
-            d_abs = abs(d)
-
-            # Find the binary exponent using binary search (no floating-point ln)
-            # Find e such that 2^e <= d_abs < 2^(e+1)
-            two = Decimal(2)
-
-            # Start with bounds - float32 exponent range is -126 to +127 for normals
-            # but we need to handle larger values for overflow detection
-            if d_abs >= 1:
-                # Search upward from 0
-                exp_estimate = 0
-                power = Decimal(1)
-                while power * 2 <= d_abs:
-                    power *= 2
-                    exp_estimate += 1
-                # Now 2^exp_estimate <= d_abs < 2^(exp_estimate+1)
-            else:
-                # Search downward from 0
-                exp_estimate = -1
-                power = Decimal("0.5")
-                while power > d_abs:
-                    power /= 2
-                    exp_estimate -= 1
-                # Now 2^exp_estimate <= d_abs < 2^(exp_estimate+1)
-
-            # Verify our exponent is correct
-            power_low = two**exp_estimate
-            power_high = two ** (exp_estimate + 1)
-            assert (
-                power_low <= d_abs < power_high
-            ), f"Exponent calc error: {power_low} <= {d_abs} < {power_high}"
-
-            # IEEE 754 single precision:
-            # - Exponent bias is 127
-            # - Mantissa has 23 explicit bits (24 including implicit 1)
-            # - Biased exponent range: 1-254 for normals, 0 for subnormals
-
-            biased_exp = exp_estimate + 127
-
-            if biased_exp >= 255:
-                # Overflow to infinity
-                return FP_NEG_INF if sign else FP_POS_INF
-            elif biased_exp >= 1:
-                # Normal number
-                # Scale to get 26+ bits for guard/round/sticky extraction
-                # We want significand * 2^25 where significand = d_abs / 2^exp_estimate
-                # So we compute d_abs * 2^(25 - exp_estimate)
-
-                # To get more sticky bits, scale by 2^50 instead of 2^25
-                scale_exp = 50 - exp_estimate
-                if scale_exp >= 0:
-                    scaled = d_abs * (two**scale_exp)
-                else:
-                    scaled = d_abs / (two ** (-scale_exp))
-
-                # Convert to integer - this is now exact for values that fit
-                scaled_int = int(scaled)
-                remainder = scaled - scaled_int
-
-                # scaled_int has bits arranged as:
-                # [50:27] = 24-bit mantissa (with implicit 1)
-                # [26] = guard
-                # [25] = round
-                # [24:0] = sticky bits (plus remainder)
-
-                mantissa_24 = scaled_int >> 27
-                guard = (scaled_int >> 26) & 1
-                round_bit = (scaled_int >> 25) & 1
-                sticky = 1 if ((scaled_int & 0x1FFFFFF) != 0 or remainder != 0) else 0
-
-                # Round to nearest even (RNE)
-                lsb = mantissa_24 & 1
-                round_up = guard & (round_bit | sticky | lsb)
-
-                if round_up:
-                    mantissa_24 += 1
-                    # Check for mantissa overflow (1.111...1 + 1 = 10.000...0)
-                    if mantissa_24 >= (1 << 24):
-                        mantissa_24 >>= 1
-                        biased_exp += 1
-                        if biased_exp >= 255:
-                            return FP_NEG_INF if sign else FP_POS_INF
-
-                # Remove implicit 1 bit to get 23-bit mantissa
-                mantissa_23 = mantissa_24 & 0x7FFFFF
-                return (sign << 31) | (biased_exp << 23) | mantissa_23
-            else:
-                # Subnormal or underflow
-                # For subnormals, biased_exp = 0, and we denormalize
-                shift = 1 - biased_exp  # How much to right-shift the mantissa
-
-                if shift >= 25:
-                    # Complete underflow to zero
-                    return FP_NEG_ZERO if sign else FP_POS_ZERO
-
-                # Scale for subnormal: we need bits positioned for 2^(-126) base
-                # Scale by 2^(50 + biased_exp - 1) = 2^(49 + biased_exp)
-                scale_exp = 49 + biased_exp - exp_estimate
-                if scale_exp >= 0:
-                    scaled = d_abs * (two**scale_exp)
-                else:
-                    scaled = d_abs / (two ** (-scale_exp))
-
-                scaled_int = int(scaled)
-                remainder = scaled - scaled_int
-
-                # Extract mantissa, guard, round, sticky
-                mantissa = scaled_int >> 27
-                guard = (scaled_int >> 26) & 1
-                round_bit = (scaled_int >> 25) & 1
-                sticky = 1 if ((scaled_int & 0x1FFFFFF) != 0 or remainder != 0) else 0
-
-                # Round to nearest even
-                lsb = mantissa & 1
-                round_up = guard & (round_bit | sticky | lsb)
-
-                if round_up:
-                    mantissa += 1
-                    # If mantissa overflows to 2^23, it becomes smallest normal
-                    if mantissa >= (1 << 23):
-                        return (sign << 31) | (1 << 23)  # Smallest normal
-
-                mantissa_23 = mantissa & 0x7FFFFF
-                return (sign << 31) | mantissa_23  # biased_exp = 0 for subnormal
-
-        # Convert operands to Decimal
-        a_dec = float32_to_decimal(a_bits)
-        b_dec = float32_to_decimal(b_bits)
-        c_dec = float32_to_decimal(c_bits)
-
-        # Compute FMA exactly
-        result_dec = a_dec * b_dec + c_dec
-
-        # Convert back to float32 (single rounding)
-        return decimal_to_float32(result_dec)
+        # Product is finite but c is infinity
+        if c_inf:
+            return FP_NEG_INF if (c_bits >> 31) & 1 else FP_POS_INF
+
+    # All operands are finite: every float32 is an integer times a power of
+    # two, so a * b + c is computed exactly on Python ints
+    a_sign, a_sig, a_exp = _unpack_float32(a_bits)
+    b_sign, b_sig, b_exp = _unpack_float32(b_bits)
+    c_sign, c_sig, c_exp = _unpack_float32(c_bits)
+
+    prod_sign = a_sign ^ b_sign
+    prod_sig = a_sig * b_sig
+    prod_exp = a_exp + b_exp
+
+    if prod_sig == 0 and c_sig == 0:
+        # (±0) + (±0) is -0 only when both terms are -0
+        return FP_NEG_ZERO if (prod_sign and c_sign) else FP_POS_ZERO
+
+    # Align both terms to the smaller exponent so the sum is an exact integer
+    exp = min(prod_exp, c_exp)
+    prod_term = prod_sig << (prod_exp - exp)
+    c_term = c_sig << (c_exp - exp)
+    total = (-prod_term if prod_sign else prod_term) + (-c_term if c_sign else c_term)
+
+    if total == 0:
+        # Exact cancellation rounds to +0 under round-to-nearest-even
+        return FP_POS_ZERO
+
+    sign = 1 if total < 0 else 0
+    sig = -total if sign else total
+
+    # Keep 24 significant bits, or fewer once the result drops below the
+    # smallest normal (LSB weight never goes below 2^-149)
+    lsb_exp = max(exp + sig.bit_length() - 24, -149)
+    shift = lsb_exp - exp
+
+    if shift > 0:
+        # Round to nearest even using the discarded bits
+        half = 1 << (shift - 1)
+        discarded = sig & ((half << 1) - 1)
+        sig >>= shift
+        if discarded > half or (discarded == half and sig & 1):
+            sig += 1
+            # Check for significand overflow (1.111...1 + 1 = 10.000...0)
+            if sig >> 24:
+                sig >>= 1
+                lsb_exp += 1
+    else:
+        # Result is exactly representable
+        sig <<= -shift
 
+    if sig < 0x800000:
+        # Subnormal (biased exponent 0), including zero after underflow
+        return (sign << 31) | sig
 
-def _round_to_nearest_even(value: float) -> int:
-    """Round to nearest even (RNE) and return as int."""
-    # Python's round() implements bankers rounding (ties to even).
-    return int(round(value))
+    biased_exp = lsb_exp + 150
+    if biased_exp >= 255:
+        # Overflow to infinity
+        return FP_NEG_INF if sign else FP_POS_INF
+    return (sign << 31) | (biased_exp << 23) | (sig & 0x7FFFFF)
 
 
 # IEEE 754 single-precision constants
-FP_POS_ZERO = 0x00000000
-FP_NEG_ZERO = 0x80000000
-FP_POS_INF = 0x7F800000
-FP_NEG_INF = 0xFF800000
-FP_CANONICAL_NAN = 0x7FC00000  # Canonical quiet NaN
+FP_POS_ZERO: Final[int] = 0x00000000
+FP_NEG_ZERO: Final[int] = 0x80000000
+FP_POS_INF: Final[int] = 0x7F800000
+FP_NEG_INF: Final[int] = 0xFF800000
+FP_CANONICAL_NAN: Final[int] = 0x7FC00000  # Canonical quiet NaN
 
 # Masks for IEEE 754 single-precision
-FP_SIGN_MASK = 0x80000000
-FP_EXP_MASK = 0x7F800000
-FP_MANT_MASK = 0x007FFFFF
-MASK32 = 0xFFFFFFFF
+FP_SIGN_MASK: Final[int] = 0x80000000
+FP_EXP_MASK: Final[int] = 0x7F800000
+FP_MANT_MASK: Final[int] = 0x007FFFFF
+MASK32: Final[int] = 0xFFFFFFFF
+
+
+# Pre-compiled converters between a 32-bit pattern and its float32 value.
+# Both sides use the same byte order, so native little-endian is fine.
+_PACK_U32 = struct.Struct("<I").pack
+_UNPACK_U32 = struct.Struct("<I").unpack
+_PACK_F32 = struct.Struct("<f").pack
+_UNPACK_F32 = struct.Struct("<f").unpack
 
 
 def bits_to_float(bits: int) -> float:
     """Convert 32-bit integer to IEEE 754 single-precision float."""
-    packed = struct.pack(">I", bits & MASK32)
-    return struct.unpack(">f", packed)[0]
+    return _UNPACK_F32(_PACK_U32(bits & MASK32))[0]
 
 
 def float_to_bits(f: float) -> int:
@@ -326,11 +201,11 @@ def float_to_bits(f: float) -> int:
     if math.isinf(f):
         return FP_NEG_INF if f < 0.0 else FP_POS_INF
     try:
-        packed = struct.pack(">f", f)
+        packed = _PACK_F32(f)
     except OverflowError:
         # Value too large for float32: saturate to signed infinity.
         return FP_NEG_INF if f < 0.0 else FP_POS_INF
-    return struct.unpack(">I", packed)[0]
+    return _UNPACK_U32(packed)[0]
 
 
 def is_nan(bits: int) -> bool:
@@ -366,9 +241,7 @@ def is_negative(bits: int) -> bool:
 
 def canonicalize_nan(bits: int) -> int:
     """Convert any NaN to canonical quiet NaN."""
-    if is_nan(bits):
-        return FP_CANONICAL_NAN
-    return bits
+    return FP_CANONICAL_NAN if (bits & 0x7FFFFFFF) > FP_POS_INF else bits
 
 
 # ============================================================================
@@ -376,31 +249,34 @@ def canonicalize_nan(bits: int) -> int:
 # ============================================================================
 
 
+# The arithmetic ops test for NaN inline: with the sign cleared, a NaN is any
+# pattern above +inf. float_to_bits already maps a NaN result to the
+# canonical NaN, so results need no separate canonicalize_nan pass.
+
+
 def fadd_s(rs1_bits: int, rs2_bits: int) -> int:
     """FADD.S: rd = rs1 + rs2 (single-precision add)."""
-    if is_nan(rs1_bits) or is_nan(rs2_bits):
+    if (rs1_bits & 0x7FFFFFFF) > FP_POS_INF or (rs2_bits & 0x7FFFFFFF) > FP_POS_INF:
         return FP_CANONICAL_NAN
     f1 = bits_to_float(rs1_bits)
     f2 = bits_to_float(rs2_bits)
     result = f1 + f2
-    result_bits = float_to_bits(result)
-    return canonicalize_nan(result_bits)
+    return float_to_bits(result)
 
 
 def fsub_s(rs1_bits: int, rs2_bits: int) -> int:
     """FSUB.S: rd = rs1 - rs2 (single-precision subtract)."""
-    if is_nan(rs1_bits) or is_nan(rs2_bits):
+    if (rs1_bits & 0x7FFFFFFF) > FP_POS_INF or (rs2_bits & 0x7FFFFFFF) > FP_POS_INF:
         return FP_CANONICAL_NAN
     f1 = bits_to_float(rs1_bits)
     f2 = bits_to_float(rs2_bits)
     result = f1 - f2
-    result_bits = float_to_bits(result)
-    return canonicalize_nan(result_bits)
+    return float_to_bits(result)
 
 
 def fmul_s(rs1_bits: int, rs2_bits: int) -> int:
     """FMUL.S: rd = rs1 * rs2 (single-precision multiply)."""
-    if is_nan(rs1_bits) or is_nan(rs2_bits):
+    if (rs1_bits & 0x7FFFFFFF) > FP_POS_INF or (rs2_bits & 0x7FFFFFFF) > FP_POS_INF:
         return FP_CANONICAL_NAN
     # Handle 0 * inf = NaN
     if (is_zero(rs1_bits) and is_inf(rs2_bits)) or (
@@ -410,13 +286,12 @@ def fmul_s(rs1_bits: int, rs2_bits: int) -> int:
     f1 = bits_to_float(rs1_bits)
     f2 = bits_to_float(rs2_bits)
     result = f1 * f2
-    result_bits = float_to_bits(result)
-    return canonicalize_nan(result_bits)
+    return float_to_bits(result)
 
 
 def fdiv_s(rs1_bits: int, rs2_bits: int) -> int:
     """FDIV.S: rd = rs1 / rs2 (single-precision divide)."""
-    if is_nan(rs1_bits) or is_nan(rs2_bits):
+    if (rs1_bits & 0x7FFFFFFF) > FP_POS_INF or (rs2_bits & 0x7FFFFFFF) > FP_POS_INF:
         return FP_CANONICAL_NAN
     # Handle special cases
     if is_inf(rs1_bits) and is_inf(rs2_bits):
@@ -430,21 +305,19 @@ def fdiv_s(rs1_bits: int, rs2_bits: int) -> int:
         sign = (rs1_bits ^ rs2_bits) & FP_SIGN_MASK
         return FP_POS_INF | sign
     result = f1 / f2
-    result_bits = float_to_bits(result)
-    return canonicalize_nan(result_bits)
+    return float_to_bits(result)
 
 
 def fsqrt_s(rs1_bits: int, _unused: int = 0) -> int:
     """FSQRT.S: rd = sqrt(rs1) (single-precision square root)."""
-    if is_nan(rs1_bits):
+    if (rs1_bits & 0x7FFFFFFF) > FP_POS_INF:
         return FP_CANONICAL_NAN
     if is_negative(rs1_bits) and not is_zero(rs1_bits):
         # sqrt of negative number is NaN
         return FP_CANONICAL_NAN
     f1 = bits_to_float(rs1_bits)
     result = math.sqrt(f1)
-    result_bits = float_to_bits(result)
-    return canonicalize_nan(result_bits)
+    return float_to_bits(result)
 
 
 def _negate_float32(bits: int) -> int:
@@ -467,8 +340,7 @@ def fmadd_s(rs1_bits: int, rs2_bits: int, rs3_bits: int) -> int:
         if is_inf(rs3_bits) and ((rs3_bits >> 31) & 1) != prod_sign:
             return FP_CANONICAL_NAN
     # Use true single-precision FMA
-    result_bits = _fma_float32(rs1_bits, rs2_bits, rs3_bits)
-    return canonicalize_nan(result_bits)
+    return _fma_float32(rs1_bits, rs2_bits, rs3_bits)
 
 
 def fmsub_s(rs1_bits: int, rs2_bits: int, rs3_bits: int) -> int:
@@ -486,8 +358,7 @@ def fmsub_s(rs1_bits: int, rs2_bits: int, rs3_bits: int) -> int:
         if is_inf(rs3_bits) and c_negated_sign != prod_sign:
             return FP_CANONICAL_NAN
     # FMSUB = FMA(a, b, -c)
-    result_bits = _fma_float32(rs1_bits, rs2_bits, _negate_float32(rs3_bits))
-    return canonicalize_nan(result_bits)
+    return _fma_float32(rs1_bits, rs2_bits, _negate_float32(rs3_bits))
 
 
 def fnmadd_s(rs1_bits: int, rs2_bits: int, rs3_bits: int) -> int:
@@ -506,10 +377,7 @@ def fnmadd_s(rs1_bits: int, rs2_bits: int, rs3_bits: int) -> int:
         if is_inf(rs3_bits) and c_negated_sign != negated_prod_sign:
             return FP_CANONICAL_NAN
     # FNMADD = FMA(-a, b, -c) = -(a*b) - c
-    result_bits = _fma_float32(
-        _negate_float32(rs1_bits), rs2_bits, _negate_float32(rs3_bits)
-    )
-    return canonicalize_nan(result_bits)
+    return _fma_float32(_negate_float32(rs1_bits), rs2_bits, _negate_float32(rs3_bits))
 
 
 def fnmsub_s(rs1_bits: int, rs2_bits: int, rs3_bits: int) -> int:
@@ -527,8 +395,7 @@ def fnmsub_s(rs1_bits: int, rs2_bits: int, rs3_bits: int) -> int:
         if is_inf(rs3_bits) and ((rs3_bits >> 31) & 1) != negated_prod_sign:
             return FP_CANONICAL_NAN
     # FNMSUB = FMA(-a, b, c) = -(a*b) + c
-    result_bits = _fma_float32(_negate_float32(rs1_bits), rs2_bits, rs3_bits)
-    return canonicalize_nan(result_bits)
+    return _fma_float32(_negate_float32(rs1_bits), rs2_bits, rs3_bits)
 
 
 # ============================================================================
@@ -560,6 +427,17 @@ def fsgnjx_s(rs1_bits: int, rs2_bits: int) -> int:
 # ============================================================================
 
 
+def _order_key(bits: int) -> int:
+    """Map non-NaN float32 bits to an unsigned key with the same ordering.
+
+    Positive values get the sign bit set; negative values are inverted so a
+    larger magnitude gives a smaller key. Only -0 and +0 compare unequal as
+    keys while being equal as floats, and callers handle zeros first.
+    """
+    bits &= MASK32
+    return bits ^ MASK32 if bits & FP_SIGN_MASK else bits ^ FP_SIGN_MASK
+
+
 def fmin_s(rs1_bits: int, rs2_bits: int) -> int:
     """FMIN.S: rd = min(rs1, rs2) with IEEE 754-2019 semantics."""
     # If either is signaling NaN, return canonical NaN
@@ -575,9 +453,7 @@ def fmin_s(rs1_bits: int, rs2_bits: int) -> int:
     # Handle -0 vs +0: -0 is less than +0
     if is_zero(rs1_bits) and is_zero(rs2_bits):
         return rs1_bits if is_negative(rs1_bits) else rs2_bits
-    f1 = bits_to_float(rs1_bits)
-    f2 = bits_to_float(rs2_bits)
-    if f1 <= f2:
+    if _order_key(rs1_bits) <= _order_key(rs2_bits):
         return rs1_bits
     return rs2_bits
 
@@ -595,9 +471,7 @@ def fmax_s(rs1_bits: int, rs2_bits: int) -> int:
     # Handle -0 vs +0: +0 is greater than -0
     if is_zero(rs1_bits) and is_zero(rs2_bits):
         return rs1_bits if not is_negative(rs1_bits) else rs2_bits
-    f1 = bits_to_float(rs1_bits)
-    f2 = bits_to_float(rs2_bits)
-    if f1 >= f2:
+    if _order_key(rs1_bits) >= _order_key(rs2_bits):
         return rs1_bits
     return rs2_bits
 
@@ -609,30 +483,18 @@ def fmax_s(rs1_bits: int, rs2_bits: int) -> int:
 
 def feq_s(rs1_bits: int, rs2_bits: int) -> int:
     """FEQ.S: rd = (rs1 == rs2) ? 1 : 0. Returns 0 if either is NaN."""
-    if is_nan(rs1_bits) or is_nan(rs2_bits):
-        return 0
-    # +0 and -0 are equal
-    if is_zero(rs1_bits) and is_zero(rs2_bits):
-        return 1
-    return 1 if rs1_bits == rs2_bits else 0
+    # Native float equality is already false for NaN and true for +0 == -0
+    return 1 if bits_to_float(rs1_bits) == bits_to_float(rs2_bits) else 0
 
 
 def flt_s(rs1_bits: int, rs2_bits: int) -> int:
     """FLT.S: rd = (rs1 < rs2) ? 1 : 0. Returns 0 if either is NaN."""
-    if is_nan(rs1_bits) or is_nan(rs2_bits):
-        return 0
-    f1 = bits_to_float(rs1_bits)
-    f2 = bits_to_float(rs2_bits)
-    return 1 if f1 < f2 else 0
+    return 1 if bits_to_float(rs1_bits) < bits_to_float(rs2_bits) else 0
 
 
 def fle_s(rs1_bits: int, rs2_bits: int) -> int:
     """FLE.S: rd = (rs1 <= rs2) ? 1 : 0. Returns 0 if either is NaN."""
-    if is_nan(rs1_bits) or is_nan(rs2_bits):
-        return 0
-    f1 = bits_to_float(rs1_bits)
-    f2 = bits_to_float(rs2_bits)
-    return 1 if f1 <= f2 else 0
+    return 1 if bits_to_float(rs1_bits) <= bits_to_float(rs2_bits) else 0
 
 
 # ============================================================================
@@ -640,20 +502,36 @@ def fle_s(rs1_bits: int, rs2_bits: int) -> int:
 # ============================================================================
 
 
+def _round_to_int(bits: int) -> int:
+    """Round a finite float32 to the nearest integer, ties to even (RNE).
+
+    Works on the bit fields directly: the significand is shifted to the
+    units position and rounded from the discarded bits.
+    """
+    exp = (bits >> 23) & 0xFF
+    if exp < 126:
+        return 0  # |value| < 0.5, including zeros and subnormals
+    sig = 0x800000 | (bits & FP_MANT_MASK)
+    shift = 150 - exp
+    if shift <= 0:
+        value = sig << -shift
+    else:
+        half = 1 << (shift - 1)
+        discarded = sig & ((half << 1) - 1)
+        value = sig >> shift
+        if discarded > half or (discarded == half and value & 1):
+            value += 1
+    return -value if bits & FP_SIGN_MASK else value
+
+
 def fcvt_w_s(rs1_bits: int, _unused: int = 0) -> int:
     """FCVT.W.S: Convert float to signed 32-bit integer."""
     if is_nan(rs1_bits):
         return 0x7FFFFFFF  # Return max positive for NaN
     if is_inf(rs1_bits):
         return 0x7FFFFFFF if not is_negative(rs1_bits) else 0x80000000
-    f = bits_to_float(rs1_bits)
-    # Handle infinities and overflow
-    if f >= 2147483648.0:  # >= 2^31
-        return 0x7FFFFFFF
-    if f < -2147483648.0:  # < -2^31
-        return 0x80000000
-    # Round to nearest even (RNE)
-    result = _round_to_nearest_even(f)
+    result = _round_to_int(rs1_bits)
+    # Saturate on overflow
     if result > 2147483647:
         return 0x7FFFFFFF
     if result < -2147483648:
@@ -667,12 +545,8 @@ def fcvt_wu_s(rs1_bits: int, _unused: int = 0) -> int:
         return 0xFFFFFFFF  # Return max unsigned for NaN
     if is_inf(rs1_bits):
         return 0xFFFFFFFF if not is_negative(rs1_bits) else 0
-    f = bits_to_float(rs1_bits)
-    # Handle overflow
-    if f >= 4294967296.0:  # >= 2^32
-        return 0xFFFFFFFF
-    # Round to nearest even (RNE)
-    result = _round_to_nearest_even(f)
+    result = _round_to_int(rs1_bits)
+    # Saturate on overflow
     if result < 0:
         return 0
     if result > 0xFFFFFFFF:
@@ -717,21 +591,7 @@ def fmv_w_x(rs1_int: int, _unused: int = 0) -> int:
 # ============================================================================
 
 
-def fclass_s(rs1_bits: int, _unused: int = 0) -> int:
-    """FCLASS.S: Classify floating-point value.
-
-    Returns a 10-bit mask indicating the class:
-        bit 0: rs1 is -inf
-        bit 1: rs1 is negative normal
-        bit 2: rs1 is negative subnormal
-        bit 3: rs1 is -0
-        bit 4: rs1 is +0
-        bit 5: rs1 is positive subnormal
-        bit 6: rs1 is positive normal
-        bit 7: rs1 is +inf
-        bit 8: rs1 is signaling NaN
-        bit 9: rs1 is quiet NaN
-    """
+def _classify(rs1_bits: int) -> int:
     sign = is_negative(rs1_bits)
     exp = (rs1_bits & FP_EXP_MASK) >> 23
     mant = rs1_bits & FP_MANT_MASK
@@ -758,6 +618,33 @@ def fclass_s(rs1_bits: int, _unused: int = 0) -> int:
         return 2 if sign else 0x40  # bit 1 or bit 6
 
 
+# FCLASS depends only on the sign, the exponent, the mantissa MSB (quiet NaN)
+# and whether the rest of the mantissa is zero, so every class mask is
+# precomputed from a representative pattern, indexed by
+# sign:exp:mant[22] (bits [31:22]) followed by (mant[21:0] != 0).
+_FCLASS_TABLE = tuple(
+    _classify(((index >> 1) << 22) | (index & 1)) for index in range(2048)
+)
+
+
+def fclass_s(rs1_bits: int, _unused: int = 0) -> int:
+    """FCLASS.S: Classify floating-point value.
+
+    Returns a 10-bit mask indicating the class:
+        bit 0: rs1 is -inf
+        bit 1: rs1 is negative normal
+        bit 2: rs1 is negative subnormal
+        bit 3: rs1 is -0
+        bit 4: rs1 is +0
+        bit 5: rs1 is positive subnormal
+        bit 6: rs1 is positive normal
+        bit 7: rs1 is +inf
+        bit 8: rs1 is signaling NaN
+        bit 9: rs1 is quiet NaN
+    """
+    return _FCLASS_TABLE[((rs1_bits >> 21) & 0x7FE) | ((rs1_bits & 0x3FFFFF) != 0)]
+
+
 # ============================================================================
 # FLW/FSW - handled by memory model, not FPU
 # These functions are for symmetry in the op_tables
@@ -26,7 +26,7 @@ memory state, allowing the testbench to:
     3. Keep software and hardware memory synchronized
 
 Key Features:
-    - Byte-addressable memory (stored as dict for sparse representation)
+    - Byte-addressable memory (stored as a flat array of 32-bit words)
     - Little-endian byte ordering for word/halfword accesses
     - Integrated monitor for verifying memory writes from DUT
     - Explicit instance passing (no global state)
@@ -44,14 +44,16 @@ Usage:
     Store operations are monitored via the driver_and_monitor coroutine.
 """
 
-from cocotb.triggers import RisingEdge, FallingEdge
+from cocotb.triggers import RisingEdge
 import cocotb
+from array import array
+from collections import deque
 from typing import Any
 from config import (
     MASK32,
     MEMORY_ADDRESS_MASK,
-    MEMORY_WORD_ALIGN_MASK,
     MEMORY_SIZE_WORDS,
+    MEMORY_WORD_SIZE_BYTES,
 )
 
 
@@ -67,7 +69,8 @@ class MemoryModel:
     Attributes:
         dut: Reference to the device under test
         read_address: Address for pending load operation
-        ram_bytes: Byte-addressable memory dictionary
+        ram_words: Memory contents as unsigned 32-bit words, indexed by
+            word address (byte address >> 2)
     """
 
     def __init__(self, device_under_test: Any) -> None:
@@ -81,18 +84,15 @@ class MemoryModel:
         """
         self.dut = device_under_test
         self.read_address: int = 0  # Address for pending load operation
-        self.ram_bytes: dict[int, int] = {}  # Byte-addressable memory dictionary
+        # One entry per word of the addressable space
+        self.ram_words: array[int] = array("I", [0]) * (
+            (MEMORY_ADDRESS_MASK + 1) // MEMORY_WORD_SIZE_BYTES
+        )
 
         # Initialize testbench RAM to match DUT RAM contents
+        dut_memory = device_under_test.data_memory_for_simulation.memory
         for word_index in range(MEMORY_SIZE_WORDS):
-            self.write_word(
-                word_index * 4,
-                int(
-                    device_under_test.data_memory_for_simulation.memory[
-                        word_index
-                    ].value
-                ),
-            )
+            self.ram_words[word_index] = int(dut_memory[word_index].value) & MASK32
 
     def read_byte(self, address: int) -> int:
         """Read a single byte from memory at the specified address.
@@ -103,7 +103,8 @@ class MemoryModel:
         Returns:
             8-bit value at that address (0 if uninitialized)
         """
-        return self.ram_bytes.get(address & MEMORY_ADDRESS_MASK, 0)
+        address &= MEMORY_ADDRESS_MASK
+        return (self.ram_words[address >> 2] >> ((address & 0x3) << 3)) & 0xFF
 
     def write_byte(self, address: int, value: int) -> None:
         """Write a single byte to memory at the specified address.
@@ -112,7 +113,12 @@ class MemoryModel:
             address: Byte address to write to
             value: 8-bit value to write
         """
-        self.ram_bytes[address & MEMORY_ADDRESS_MASK] = value & 0xFF
+        address &= MEMORY_ADDRESS_MASK
+        word_index = address >> 2
+        shift = (address & 0x3) << 3
+        self.ram_words[word_index] = (self.ram_words[word_index] & ~(0xFF << shift)) | (
+            (value & 0xFF) << shift
+        )
 
     def read_word(self, address: int) -> int:
         """Read a full 32-bit word from memory (little-endian).
@@ -121,15 +127,9 @@ class MemoryModel:
             address: Byte address (will be aligned to 4-byte boundary)
 
         Returns:
-            32-bit word value assembled from 4 bytes
+            32-bit word value
         """
-        aligned_address = address & MEMORY_WORD_ALIGN_MASK
-        return (
-            self.read_byte(aligned_address)
-            | self.read_byte(aligned_address + 1) << 8
-            | self.read_byte(aligned_address + 2) << 16
-            | self.read_byte(aligned_address + 3) << 24
-        )
+        return self.ram_words[(address & MEMORY_ADDRESS_MASK) >> 2]
 
     def write_word(self, address: int, value: int = 0) -> None:
         """Write a full 32-bit word to memory (little-endian).
@@ -138,18 +138,12 @@ class MemoryModel:
             address: Byte address (will be aligned to 4-byte boundary)
             value: 32-bit word value to write
         """
-        aligned_address = address & MEMORY_WORD_ALIGN_MASK
-
-        # Write the word as 4 bytes in little-endian order (LSB first)
-        self.write_byte(aligned_address, value & 0xFF)
-        self.write_byte(aligned_address + 1, (value >> 8) & 0xFF)
-        self.write_byte(aligned_address + 2, (value >> 16) & 0xFF)
-        self.write_byte(aligned_address + 3, (value >> 24) & 0xFF)
+        self.ram_words[(address & MEMORY_ADDRESS_MASK) >> 2] = value & MASK32
 
     async def driver_and_monitor(
         self,
-        write_data_expected_queue: list[int],
-        write_address_expected_queue: list[int],
+        write_data_expected_queue: deque[int],
+        write_address_expected_queue: deque[int],
     ) -> None:
         """Monitor memory writes from DUT and update software model.
 
@@ -157,7 +151,7 @@ class MemoryModel:
         DUT's data memory interface. It:
 
             1. Waits for reset to complete
-            2. Continuously monitors for memory write operations
+            2. Samples the write interface once per rising clock edge
             3. When write detected, verifies address and data match expected
             4. Updates software memory model to stay synchronized with hardware
 
@@ -169,28 +163,34 @@ class MemoryModel:
             AssertionError: If write address or data doesn't match expected,
                           or if unexpected write occurs
         """
+        # Resolve signal handles once; hierarchy lookups are not free per cycle
+        clock = self.dut.i_clk
+        write_enable_signal = self.dut.o_data_mem_per_byte_wr_en
+        address_signal = self.dut.o_data_mem_addr
+        write_data_signal = self.dut.o_data_mem_wr_data
+
         # Wait for reset to de-assert
-        await RisingEdge(self.dut.i_clk)
+        await RisingEdge(clock)
         while bool(self.dut.i_rst.value):
-            await RisingEdge(self.dut.i_clk)
+            await RisingEdge(clock)
 
         # Main monitoring loop
         while True:
-            # Advance clock and check for memory writes
-            await FallingEdge(self.dut.i_clk)
-            await RisingEdge(self.dut.i_clk)
+            # Advance one clock; the loop always resumes on a rising edge, so
+            # awaiting the next rising edge alone samples once per cycle
+            await RisingEdge(clock)
 
             # Check if DUT is performing a write (non-zero byte enable mask)
-            wr_mask = int(self.dut.o_data_mem_per_byte_wr_en.value) & 0xF
+            wr_mask = int(write_enable_signal.value) & 0xF
             if wr_mask:
                 # Read write address and data from DUT outputs
-                wr_addr = int(self.dut.o_data_mem_addr.value) & MASK32
-                wr_data = int(self.dut.o_data_mem_wr_data.value) & MASK32
+                wr_addr = int(address_signal.value) & MASK32
+                wr_data = int(write_data_signal.value) & MASK32
 
                 # Verify against expected values from software model
                 if write_address_expected_queue:
-                    exp_addr = write_address_expected_queue.pop(0)
-                    exp_data = write_data_expected_queue.pop(0)
+                    exp_addr = write_address_expected_queue.popleft()
+                    exp_data = write_data_expected_queue.popleft()
 
                     # Verify write address matches expected
                     assert wr_addr == exp_addr, (
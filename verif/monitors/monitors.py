@@ -44,6 +44,8 @@ Note:
 """
 
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Sequence
 from cocotb.triggers import RisingEdge, ReadOnly
 from typing import Any, Generic, TypeVar
 from config import (
@@ -68,7 +70,7 @@ class Monitor(ABC, Generic[T]):
     Subclasses implement the abstract methods to customize behavior.
     """
 
-    def __init__(self, dut: Any, expected_queue: list[T], name: str = "Monitor"):
+    def __init__(self, dut: Any, expected_queue: deque[T], name: str = "Monitor"):
         """Initialize monitor with DUT and expected queue.
 
         Args:
@@ -106,7 +108,7 @@ class Monitor(ABC, Generic[T]):
             await RisingEdge(self.dut.i_clk)
             await ReadOnly()
             if self.is_valid():
-                expected = self.expected_queue.pop(0)
+                expected = self.expected_queue.popleft()
                 actual = self.read_actual()
                 error = self.compare(actual, expected)
                 if error:
@@ -117,13 +119,13 @@ class Monitor(ABC, Generic[T]):
                 self.cycle += 1
 
 
-class RegisterFileMonitor(Monitor[list[int]]):
+class RegisterFileMonitor(Monitor[Sequence[int]]):
     """Monitor for register file verification."""
 
     def __init__(
         self,
         dut: Any,
-        expected_queue: list[list[int]],
+        expected_queue: deque[Sequence[int]],
         signal_paths: DUTSignalPaths | None = None,
     ) -> None:
         """Initialize register file monitor.
@@ -150,7 +152,7 @@ class RegisterFileMonitor(Monitor[list[int]]):
         """Read all register values from hardware."""
         return [int(self._ram[i].value) for i in range(NUM_REGISTERS)]
 
-    def compare(self, actual: list[int], expected: list[int]) -> str | None:
+    def compare(self, actual: Sequence[int], expected: Sequence[int]) -> str | None:
         """Compare actual and expected register file states."""
         for reg in range(FIRST_WRITABLE_REGISTER, NUM_REGISTERS):
             hw_val = actual[reg]
@@ -163,7 +165,7 @@ class RegisterFileMonitor(Monitor[list[int]]):
 class ProgramCounterMonitor(Monitor[int]):
     """Monitor for program counter verification."""
 
-    def __init__(self, dut: Any, expected_queue: list[int]) -> None:
+    def __init__(self, dut: Any, expected_queue: deque[int]) -> None:
         """Initialize program counter monitor.
 
         Args:
@@ -197,7 +199,7 @@ class FPRegisterFileMonitor(Monitor[list[int]]):
     def __init__(
         self,
         dut: Any,
-        expected_queue: list[list[int]],
+        expected_queue: deque[list[int]],
         signal_paths: DUTSignalPaths | None = None,
     ) -> None:
         """Initialize FP register file monitor.
@@ -241,7 +243,7 @@ class FPRegisterFileMonitor(Monitor[list[int]]):
 # Standalone functions for backward compatibility
 async def regfile_monitor(
     dut: Any,
-    expected_queue: list[list[int]],
+    expected_queue: deque[Sequence[int]],
     signal_paths: DUTSignalPaths | None = None,
 ) -> None:
     """Monitor and validate register file values written by the DUT.
@@ -259,7 +261,7 @@ async def regfile_monitor(
     await monitor.run()
 
 
-async def pc_monitor(dut: Any, expected_queue: list[int]) -> None:
+async def pc_monitor(dut: Any, expected_queue: deque[int]) -> None:
     """Monitor and validate program counter values from the DUT.
 
     Monitors the program counter (PC) output from the CPU and compares against expected
@@ -272,7 +274,7 @@ async def pc_monitor(dut: Any, expected_queue: list[int]) -> None:
 
 async def fp_regfile_monitor(
     dut: Any,
-    expected_queue: list[list[int]],
+    expected_queue: deque[list[int]],
     signal_paths: DUTSignalPaths | None = None,
 ) -> None:
     """Monitor and validate FP register file values written by the DUT.
@@ -22,8 +22,17 @@ making debugging and waveform correlation much easier.
 """
 
 import cocotb
+import logging
 from encoders.op_tables import LOADS, STORES, BRANCHES, JUMPS
 
+# Coverage summary category for each non-ALU operation; anything absent is ALU
+_OP_CATEGORY: dict[str, str] = (
+    dict.fromkeys(LOADS, "Memory Operations")
+    | dict.fromkeys(STORES, "Memory Operations")
+    | dict.fromkeys(BRANCHES, "Branch Operations")
+    | dict.fromkeys(JUMPS, "Jump Operations")
+)
+
 
 class InstructionLogger:
     """Structured logging for RISC-V instruction execution.
@@ -62,12 +71,13 @@ class InstructionLogger:
             address: Memory address (for loads/stores)
             branch_taken: Branch decision (for branches)
         """
-        # Build message components
-        parts = [
-            f"[Cycle {cycle:5d}]",
-            f"{operation:6s}",
-            f"PC: 0x{pc_current:08x} → 0x{pc_expected:08x}",
-        ]
+        # Skip all formatting when INFO output is silenced
+        if not cocotb.log.isEnabledFor(logging.INFO):
+            return
+
+        # Build the optional trailing components; the fixed prefix is
+        # formatted lazily by the logging call
+        parts = []
 
         # Add register writeback info
         if destination_register is not None:
@@ -88,7 +98,14 @@ class InstructionLogger:
         if branch_taken is not None:
             parts.append(f"[{'TAKEN' if branch_taken else 'NOT-TAKEN'}]")
 
-        cocotb.log.info(" ".join(parts))
+        cocotb.log.info(
+            "[Cycle %5d] %-6s PC: 0x%08x → 0x%08x %s",
+            cycle,
+            operation,
+            pc_current,
+            pc_expected,
+            " ".join(parts),
+        )
 
     @staticmethod
     def log_memory_operation(
@@ -107,16 +124,26 @@ class InstructionLogger:
             data: Data value (for stores)
             mask: Byte enable mask (for stores)
         """
+        if not cocotb.log.isEnabledFor(logging.INFO):
+            return
+
         if operation in LOADS:
             cocotb.log.info(
-                f"[Cycle {cycle:5d}] {operation:6s} loading from address 0x{address:08x}"
+                "[Cycle %5d] %-6s loading from address 0x%08x",
+                cycle,
+                operation,
+                address,
             )
         elif operation in STORES:
             mask_str = f" mask=0b{mask:04b}" if mask is not None else ""
             data_str = f" data=0x{data:08x}" if data is not None else ""
             cocotb.log.info(
-                f"[Cycle {cycle:5d}] {operation:6s} storing to 0x{address:08x}"
-                f"{data_str}{mask_str}"
+                "[Cycle %5d] %-6s storing to 0x%08x%s%s",
+                cycle,
+                operation,
+                address,
+                data_str,
+                mask_str,
             )
 
     @staticmethod
@@ -162,8 +189,12 @@ class InstructionLogger:
         """
         reg_str = f" x{register}" if register is not None else ""
         cocotb.log.error(
-            f"[Cycle {cycle:5d}] MISMATCH {component}{reg_str}: "
-            f"expected=0x{expected:08x}, actual=0x{actual:08x}"
+            "[Cycle %5d] MISMATCH %s%s: expected=0x%08x, actual=0x%08x",
+            cycle,
+            component,
+            reg_str,
+            expected,
+            actual,
         )
 
     @staticmethod
@@ -176,34 +207,27 @@ class InstructionLogger:
             instruction_counts: Dict mapping operation → execution count
             threshold: Minimum required execution count
         """
+        if not cocotb.log.isEnabledFor(logging.INFO):
+            return
+
         cocotb.log.info("=" * 60)
         cocotb.log.info("INSTRUCTION COVERAGE SUMMARY")
         cocotb.log.info("=" * 60)
 
-        # Group by category
-        alu_ops = []
-        mem_ops = []
-        branch_ops = []
-        jump_ops = []
-
-        for op, count in sorted(instruction_counts.items()):
-            if op in LOADS or op in STORES:
-                mem_ops.append((op, count))
-            elif op in BRANCHES:
-                branch_ops.append((op, count))
-            elif op in JUMPS:
-                jump_ops.append((op, count))
-            else:
-                alu_ops.append((op, count))
+        # Group by category in a single pass, in display order
+        categories: dict[str, list[tuple[str, int]]] = {
+            "ALU Operations": [],
+            "Memory Operations": [],
+            "Branch Operations": [],
+            "Jump Operations": [],
+        }
+        for op, count in instruction_counts.items():
+            categories[_OP_CATEGORY.get(op, "ALU Operations")].append((op, count))
 
         # Log each category
-        for category, ops in [
-            ("ALU Operations", alu_ops),
-            ("Memory Operations", mem_ops),
-            ("Branch Operations", branch_ops),
-            ("Jump Operations", jump_ops),
-        ]:
+        for category, ops in categories.items():
             if ops:
+                ops.sort()
                 cocotb.log.info(f"\n{category}:")
                 for op, count in ops:
                     status = "✓" if count >= threshold else "✗"
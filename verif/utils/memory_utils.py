@@ -27,6 +27,7 @@ from config import (
     BYTE_ALIGNMENT,
     HALFWORD_ALIGNMENT,
     WORD_ALIGNMENT,
+    MASK32,
     MEMORY_BYTE_OFFSET_MASK,
 )
 from exceptions import AlignmentError
@@ -69,7 +70,7 @@ def is_aligned(address: int, alignment: int) -> bool:
         >>> is_aligned(0x1002, 2)
         True
     """
-    return (address % alignment) == 0
+    return (address & (alignment - 1)) == 0
 
 
 def ensure_aligned(address: int, alignment: int, operation: str) -> int:
@@ -92,7 +93,8 @@ def ensure_aligned(address: int, alignment: int, operation: str) -> int:
         >>> ensure_aligned(0x1002, 4, "lw")  # doctest: +SKIP
         Traceback: AlignmentError
     """
-    if not is_aligned(address, alignment):
+    # Alignments are powers of two; test the low bits inline
+    if address & (alignment - 1):
         raise AlignmentError(
             f"{operation} requires {alignment}-byte alignment, got address 0x{address:08x}",
             address=address,
@@ -119,6 +121,18 @@ def get_byte_offset(address: int) -> int:
     return address & MEMORY_BYTE_OFFSET_MASK
 
 
+# Byte-enable mask per store type, indexed by byte offset within the word:
+#   sb: single byte at the offset (0b0001, 0b0010, 0b0100, 0b1000)
+#   sh: halfwords are 2-byte aligned, so offsets 0-1 -> bytes 0,1 (0b0011)
+#       and offsets 2-3 -> bytes 2,3 (0b1100)
+#   sw: all four bytes (0b1111)
+_STORE_BYTE_MASKS: dict[str, tuple[int, int, int, int]] = {
+    "sb": (0b0001, 0b0010, 0b0100, 0b1000),
+    "sh": (0b0011, 0b0011, 0b1100, 0b1100),
+    "sw": (0b1111, 0b1111, 0b1111, 0b1111),
+}
+
+
 def calculate_byte_mask_for_store(operation: str, byte_offset: int) -> int:
     """Calculate byte-enable mask for store operations.
 
@@ -144,7 +158,8 @@ def calculate_byte_mask_for_store(operation: str, byte_offset: int) -> int:
         4-bit mask indicating which bytes to write
 
     Raises:
-        ValueError: If operation is not a valid store instruction
+        ValueError: If operation is not a valid store instruction, or
+            byte_offset is outside 0-3
 
     Examples:
         >>> calculate_byte_mask_for_store("sb", 0)  # Store to byte 0
@@ -158,25 +173,26 @@ def calculate_byte_mask_for_store(operation: str, byte_offset: int) -> int:
         >>> calculate_byte_mask_for_store("sw", 0)  # Store full word
         15  # 0b1111
     """
-    if operation == "sb":
-        # Store byte: Write single byte at position specified by byte_offset
-        # Offset 0 -> 0b0001, offset 1 -> 0b0010, offset 2 -> 0b0100, offset 3 -> 0b1000
-        return 1 << byte_offset
-
-    elif operation == "sh":
-        # Store halfword: Write 2 consecutive bytes
-        # Halfwords must be 2-byte aligned, so offset is 0, 1, 2, or 3
-        # But actual halfword addresses are offset 0 or 2 (aligned)
-        # Offset 0 or 1 -> bytes 0,1 (0b0011)
-        # Offset 2 or 3 -> bytes 2,3 (0b1100)
-        return 0b1100 if byte_offset > 1 else 0b0011
-
-    elif operation == "sw":
-        # Store word: Write all 4 bytes
-        return 0b1111
-
-    else:
-        raise ValueError(f"Unknown store operation: {operation}")
+    try:
+        masks = _STORE_BYTE_MASKS[operation]
+    except KeyError:
+        raise ValueError(f"Unknown store operation: {operation}") from None
+    # Range-check explicitly so a negative offset cannot wrap into the table
+    if not 0 <= byte_offset <= 3:
+        raise ValueError(f"Byte offset must be 0-3, got {byte_offset}")
+    return masks[byte_offset]
+
+
+_OPERATION_ALIGNMENTS: dict[str, int] = {
+    "lw": WORD_ALIGNMENT,
+    "sw": WORD_ALIGNMENT,
+    "lh": HALFWORD_ALIGNMENT,
+    "lhu": HALFWORD_ALIGNMENT,
+    "sh": HALFWORD_ALIGNMENT,
+    "lb": BYTE_ALIGNMENT,
+    "lbu": BYTE_ALIGNMENT,
+    "sb": BYTE_ALIGNMENT,
+}
 
 
 def get_alignment_for_operation(operation: str) -> int:
@@ -199,14 +215,10 @@ def get_alignment_for_operation(operation: str) -> int:
         >>> get_alignment_for_operation("lb")
         1
     """
-    if operation in ("lw", "sw"):
-        return WORD_ALIGNMENT
-    elif operation in ("lh", "lhu", "sh"):
-        return HALFWORD_ALIGNMENT
-    elif operation in ("lb", "lbu", "sb"):
-        return BYTE_ALIGNMENT
-    else:
-        raise ValueError(f"Unknown memory operation: {operation}")
+    try:
+        return _OPERATION_ALIGNMENTS[operation]
+    except KeyError:
+        raise ValueError(f"Unknown memory operation: {operation}") from None
 
 
 def constrain_address_to_range(
@@ -231,12 +243,25 @@ def constrain_address_to_range(
         >>> constrain_address_to_range(0x100, 0x2000, 4)
         0x100
     """
+    # Memory sizes are normally powers of two: wrap and align with one mask
+    if max_address > 0 and max_address & (max_address - 1) == 0:
+        return address & (max_address - 1) & ~(alignment - 1)
     # First constrain to range
     constrained = address % max_address
     # Then align
     return align_address(constrained, alignment)
 
 
+def _aligned_multiple_range(
+    offset: int, alignment: int, low: int, high: int
+) -> tuple[int, int]:
+    """Return the k range for which offset + k * alignment lies in [low, high].
+
+    The range is empty when the first bound exceeds the second.
+    """
+    return -((offset - low) // alignment), (high - offset) // alignment
+
+
 def generate_aligned_immediate(
     base_value: int,
     target_alignment: int,
@@ -246,17 +271,20 @@ def generate_aligned_immediate(
 ) -> int:
     """Generate an immediate value that produces aligned address when added to base.
 
-    Uses rejection sampling to efficiently find a valid immediate value.
-    Functionally equivalent to the original while-loop approach but more
-    organized and with optional memory constraints.
+    Picks uniformly among the immediates in range whose sum with the base is
+    aligned. These form an arithmetic sequence, so one is drawn directly
+    rather than by rejection sampling.
 
     Args:
         base_value: Base register value
         target_alignment: Required alignment for final address (2 or 4)
         immediate_min: Minimum immediate value (default: -2048 for 12-bit signed)
         immediate_max: Maximum immediate value (default: 2047 for 12-bit signed)
-        memory_size_constraint: If provided, ensures (base + imm) falls within
-                               allocated memory space [0, memory_size)
+        memory_size_constraint: If provided, prefer immediates for which
+                               (base + imm) & MASK32 falls within allocated
+                               memory space [0, memory_size). When no aligned
+                               immediate in range reaches that space, the
+                               constraint is dropped and only alignment holds.
 
     Returns:
         Immediate value that, when added to base, produces aligned address
@@ -269,33 +297,36 @@ def generate_aligned_immediate(
     """
     import random
 
-    # Use rejection sampling (same as original while loop approach)
-    # This is more efficient than pre-computing all valid values
-    max_attempts = 1000  # Safety limit to prevent infinite loops
-
-    for _ in range(max_attempts):
-        immediate_value = random.randint(immediate_min, immediate_max)
-        effective_address = (base_value + immediate_value) & 0xFFFFFFFF
-
-        # Check alignment requirement
-        if effective_address % target_alignment != 0:
-            continue
-
-        # Check memory size constraint if provided
-        if memory_size_constraint is not None:
-            constrained_address = effective_address % memory_size_constraint
-            if constrained_address >= memory_size_constraint:
-                continue
-
-        # Found valid immediate
-        return immediate_value
-
-    # Fallback: calculate offset needed for alignment (ignore memory constraint)
-    misalignment = base_value % target_alignment
-    offset_needed = (target_alignment - misalignment) % target_alignment
-
-    if immediate_min <= offset_needed <= immediate_max:
-        return offset_needed
-    else:
-        # Last resort: return minimum value
+    # Valid immediates are congruent to -base modulo the alignment
+    offset = -base_value & (target_alignment - 1)
+
+    if memory_size_constraint is not None:
+        # The 32-bit effective address lands in memory when base + imm falls in
+        # [0, size) shifted by -2^32, 0 or +2^32; collect each such k range
+        base_address = base_value & MASK32
+        multiple_ranges = []
+        for wrap in (-(1 << 32), 0, 1 << 32):
+            lowest, highest = _aligned_multiple_range(
+                offset,
+                target_alignment,
+                max(immediate_min, wrap - base_address),
+                min(immediate_max, wrap + memory_size_constraint - 1 - base_address),
+            )
+            if lowest <= highest:
+                multiple_ranges.append((lowest, highest))
+        if multiple_ranges:
+            pick = random.randrange(
+                sum(highest - lowest + 1 for lowest, highest in multiple_ranges)
+            )
+            for lowest, highest in multiple_ranges:
+                if pick <= highest - lowest:
+                    return offset + (lowest + pick) * target_alignment
+                pick -= highest - lowest + 1
+
+    lowest, highest = _aligned_multiple_range(
+        offset, target_alignment, immediate_min, immediate_max
+    )
+    if lowest > highest:
+        # No aligned immediate in range: return minimum value
         return immediate_min
+    return offset + random.randint(lowest, highest) * target_alignment
@@ -29,6 +29,14 @@ from config import MASK32
 
 __all__ = ["sign_extend", "to_signed32", "to_unsigned32", "to_signed33"]
 
+# Bit 31; XOR-then-subtract with it sign-extends a masked 32-bit value
+_SIGN_BIT32 = 0x80000000
+
+# (sign bit, field mask) for each width up to 64 bits; index 0 is unused
+_SIGN_EXTEND_WIDTHS: tuple[tuple[int, int], ...] = tuple(
+    (1 << (bits - 1), (1 << bits) - 1) if bits else (0, 0) for bits in range(65)
+)
+
 
 def sign_extend(val: int, bits: int) -> int:
     """Sign extend a value to a specified length in bits.
@@ -46,8 +54,12 @@ def sign_extend(val: int, bits: int) -> int:
         >>> sign_extend(0x7F, 8)  # Extend 8-bit +127 to full width
         127
     """
-    sign = 1 << (bits - 1)
-    return (val & (sign - 1)) - (val & sign)
+    if 0 < bits < len(_SIGN_EXTEND_WIDTHS):
+        sign, mask = _SIGN_EXTEND_WIDTHS[bits]
+    else:
+        sign = 1 << (bits - 1)
+        mask = (sign << 1) - 1
+    return ((val & mask) ^ sign) - sign
 
 
 def to_signed32(val: int) -> int:
@@ -59,7 +71,7 @@ def to_signed32(val: int) -> int:
     Returns:
         Signed 32-bit integer representation
     """
-    return sign_extend(val & MASK32, 32)
+    return ((val & MASK32) ^ _SIGN_BIT32) - _SIGN_BIT32
 
 
 def to_unsigned32(val: int) -> int:
@@ -86,5 +98,4 @@ def to_signed33(val: int) -> int:
     Returns:
         Python integer with correct sign (negative if bit 31 was set)
     """
-    # Just use sign_extend to get an actual negative Python int
-    return sign_extend(val & MASK32, 32)
+    return ((val & MASK32) ^ _SIGN_BIT32) - _SIGN_BIT32
@@ -72,7 +72,7 @@ def assert_equals(
     """Assert equality with enhanced error reporting."""
     if actual != expected:
         base_msg = message or f"Expected {expected}, got {actual}"
-        cocotb.log.info(f"cocotb RANDOM_SEED is {cocotb.RANDOM_SEED}")
+        cocotb.log.info("cocotb RANDOM_SEED is %s", cocotb.RANDOM_SEED)
         raise ValidationError(
             base_msg,
             actual=actual,
@@ -109,8 +109,9 @@ def assert_aligned(value: int, alignment: int, name: str = "value") -> None:
 
 def assert_bit_width(value: int, bits: int, name: str = "value") -> None:
     """Assert value fits in specified bit width."""
-    max_val = (1 << bits) - 1
-    if value < 0 or value > max_val:
+    # Any bit at or above position `bits` means the value does not fit
+    if value < 0 or value >> bits:
+        max_val = (1 << bits) - 1
         raise ValidationError(
             f"{name} exceeds {bits}-bit width",
             value=hex(value),
@@ -120,53 +121,65 @@ def assert_bit_width(value: int, bits: int, name: str = "value") -> None:
 
 
 class HardwareAssertions:
-    """Hardware-specific assertion helpers."""
+    """Hardware-specific assertion helpers.
+
+    Each check passes with a single mask test: biasing the value by the range
+    minimum maps the valid values onto the bits of one mask. Failures fall
+    through to the generic assertions for the full error report.
+    """
 
     @staticmethod
     def assert_register_valid(reg: int) -> None:
         """Assert register number is valid."""
-        assert_in_range(reg, 0, 31, "register")
+        if reg & ~0x1F:
+            assert_in_range(reg, 0, 31, "register")
 
     @staticmethod
     def assert_immediate_12bit(imm: int) -> None:
         """Assert immediate fits in 12 bits (signed)."""
-        assert_in_range(imm, -2048, 2047, "12-bit immediate")
+        if (imm + 2048) & ~0xFFF:
+            assert_in_range(imm, -2048, 2047, "12-bit immediate")
 
     @staticmethod
     def assert_immediate_20bit(imm: int) -> None:
         """Assert immediate fits in 20 bits (signed)."""
-        assert_in_range(imm, -524288, 524287, "20-bit immediate")
+        if (imm + 524288) & ~0xFFFFF:
+            assert_in_range(imm, -524288, 524287, "20-bit immediate")
 
     @staticmethod
     def assert_branch_offset(offset: int) -> None:
         """Assert branch offset is valid."""
-        assert_aligned(offset, 2, "branch offset")
-        assert_in_range(offset, -4096, 4094, "branch offset")
+        # Even and in range <=> bias fits in bits [12:1]
+        if (offset + 4096) & ~0x1FFE:
+            assert_aligned(offset, 2, "branch offset")
+            assert_in_range(offset, -4096, 4094, "branch offset")
 
     @staticmethod
     def assert_jump_offset(offset: int) -> None:
         """Assert jump offset is valid."""
-        assert_aligned(offset, 2, "jump offset")
-        assert_in_range(offset, -1048576, 1048574, "jump offset")
+        # Even and in range <=> bias fits in bits [20:1]
+        if (offset + 1048576) & ~0x1FFFFE:
+            assert_aligned(offset, 2, "jump offset")
+            assert_in_range(offset, -1048576, 1048574, "jump offset")
+
+
+_OPCODE_TYPES: dict[int, str] = {
+    0x03: "LOAD",
+    0x13: "I-ALU",
+    0x23: "STORE",
+    0x33: "R-ALU",
+    0x63: "BRANCH",
+    0x67: "JALR",
+    0x6F: "JAL",
+}
 
 
 def validate_instruction_encoding(instr: int) -> str | None:
     """Validate instruction encoding and return instruction type."""
     opcode = instr & 0x7F
-
-    opcode_map = {
-        0x03: "LOAD",
-        0x13: "I-ALU",
-        0x23: "STORE",
-        0x33: "R-ALU",
-        0x63: "BRANCH",
-        0x67: "JALR",
-        0x6F: "JAL",
-    }
-
-    if opcode not in opcode_map:
+    try:
+        return _OPCODE_TYPES[opcode]
+    except KeyError:
         raise ValidationError(
             "Invalid opcode", instruction=hex(instr), opcode=hex(opcode)
-        )
-
-    return opcode_map[opcode]
+        ) from None